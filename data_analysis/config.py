@@ -7,16 +7,22 @@ Configuration and Constants for AI-Assisted Empathetic Communication Analysis
 Contains all configuration parameters, color schemes, and plotting settings.
 """
 
+import importlib.util
 import warnings
+from types import MappingProxyType
+
+import numpy as np
 warnings.filterwarnings('ignore')
 
-# Try to import visualization libraries
-try:
-    import matplotlib.pyplot as plt
-    import seaborn as sns
-    VISUALIZATION_AVAILABLE = True
-except ImportError:
-    VISUALIZATION_AVAILABLE = False
+
+def visualization_available():
+    """Check whether matplotlib and seaborn are installed without importing them."""
+    return all(importlib.util.find_spec(name) is not None
+               for name in ('matplotlib', 'seaborn'))
+
+
+VISUALIZATION_AVAILABLE = visualization_available()
+if not VISUALIZATION_AVAILABLE:
     print("Warning: matplotlib and/or seaborn not available. Visualization features will be limited.")
 
 # ============================================================================
@@ -30,11 +36,6 @@ COLORS = {
     'neutral': '#95a5a6'
 }
 
-# Visualization styling (only if libraries are available)
-if VISUALIZATION_AVAILABLE:
-    plt.style.use('default')
-    sns.set_palette("husl")
-
 # LaTeX export settings
 PLOT_CONFIG = {
     'font.size': 12,
@@ -53,8 +54,28 @@ PLOT_CONFIG = {
     'grid.alpha': 0.3
 }
 
-if VISUALIZATION_AVAILABLE:
+_style_applied = False
+
+
+def ensure_plot_style():
+    """
+    Apply the plotting style on first use.
+
+    matplotlib and seaborn are only imported here, so modules that never plot
+    do not pay their import cost.
+    """
+    global _style_applied
+    if _style_applied or not VISUALIZATION_AVAILABLE:
+        return
+
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use('default')
+    sns.set_palette("husl")
     plt.rcParams.update(PLOT_CONFIG)
+    _style_applied = True
+
 
 # ============================================================================
 # ANALYSIS PARAMETERS
@@ -67,12 +88,40 @@ ALPHA = 0.05
 DEFAULT_DATA_FILE = 'output.csv'
 
 # Self-efficacy item indices
-SELF_EFFICACY_ITEMS = list(range(1, 8))
+SELF_EFFICACY_ITEMS = tuple(range(1, 8))
+
+# Self-efficacy dimension labels (read-only, shared by all modules)
+SELF_EFFICACY_DIMENSIONS = MappingProxyType({
+    1: 'relevant',
+    2: 'complete',
+    3: 'helpful',
+    4: 'accurate',
+    5: 'appropriate',
+    6: 'clear',
+    7: 'empathetic'
+})
+
+# Precomputed self-efficacy key strings (questionnaire keys and item columns)
+SE_KEYS_QUESTIONNAIRE = tuple(f'selfEfficacy{i}' for i in SELF_EFFICACY_ITEMS)
+SE_KEYS_PRE = tuple(f'pre_se_{i}' for i in SELF_EFFICACY_ITEMS)
+SE_KEYS_POST = tuple(f'post_se_{i}' for i in SELF_EFFICACY_ITEMS)
 
 # Age group bins
 AGE_BINS = [0, 25, 35, 100]
+AGE_BINS_NP = np.array(AGE_BINS)
 AGE_LABELS = ['18-25', '26-35', '36+']
 
+
+def _build_age_group_lut():
+    """Map each whole age 0..AGE_BINS[-1] to its AGE_LABELS index (-1 if unbinned)."""
+    lut = np.full(AGE_BINS[-1] + 1, -1, dtype=np.int8)
+    for idx, (low, high) in enumerate(zip(AGE_BINS[:-1], AGE_BINS[1:])):
+        lut[low + 1:high + 1] = idx  # right-inclusive, like pd.cut
+    return lut
+
+
+AGE_GROUP_LUT = _build_age_group_lut()
+
 # Minimum sample size for subgroup analysis
 MIN_SUBGROUP_SIZE = 10
 
@@ -95,7 +144,11 @@ OUTPUT_FILES = {
     'stress_plot': 'figure_2_post_stress',
     'pre_post_plot': 'figure_3_pre_post_trajectory',
     'effect_sizes_plot': 'figure_4_effect_sizes',
-    'power_analysis_plot': 'power_analysis'
+    'power_analysis_plot': 'power_analysis',
+    'dimensional_table': 'table_dimensional_analysis.tex',
+    'methods_section': 'methods_section.txt',
+    'results_section': 'results_section.txt',
+    'analysis_report': 'analysis_report.md'
 }
 
 # ============================================================================
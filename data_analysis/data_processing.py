@@ -10,7 +10,68 @@ Contains functions for loading, cleaning, and preprocessing study data.
 import pandas as pd
 import numpy as np
 import json
-from config import DEFAULT_DATA_FILE, SELF_EFFICACY_ITEMS
+import functools
+from dataclasses import dataclass
+from config import (
+    DEFAULT_DATA_FILE, SELF_EFFICACY_ITEMS, SELF_EFFICACY_DIMENSIONS,
+    SE_KEYS_QUESTIONNAIRE, SE_KEYS_PRE, SE_KEYS_POST
+)
+
+# Use orjson's faster parser when installed (its errors subclass json.JSONDecodeError)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Shared stand-in for missing questionnaires; must not be mutated
+_EMPTY_QUESTIONS = {}
+
+# Raw CSV columns copied into the case-level data (raw name -> processed name)
+CASE_INFO_COLUMNS = {
+    'ID': 'participant_id',
+    'Branch': 'branch',
+    'Case ID': 'case_id',
+    'Sequence': 'sequence',
+    'Age': 'age',
+    'Education': 'education',
+    'Ethnicity': 'ethnicity',
+    'Time Taken': 'time_taken',
+}
+
+CASE_MEASURE_COLUMNS = {
+    'Pre Confidence': 'pre_confidence',
+    'Post Confidence': 'post_confidence',
+    'Post Stress': 'post_stress',
+}
+
+# Only these raw columns are read; dtypes are fixed up front instead of inferred
+RAW_DATA_COLUMNS = [
+    *CASE_INFO_COLUMNS, 'Pre Questions', 'Post Questions', *CASE_MEASURE_COLUMNS
+]
+
+RAW_DATA_DTYPES = {
+    'Branch': 'category',
+    'Education': 'category',
+    'Ethnicity': 'category',
+    'Time Taken': 'float64',
+    'Pre Confidence': 'float64',
+    'Post Confidence': 'float64',
+    'Post Stress': 'float64',
+}
+
+# Study arms as categories: code 0 is the AI branch ('branch-a'), 1 is control
+GROUP_CATEGORIES = ['AI', 'Control']
+
+# Post-questionnaire keys for intervention-specific measures
+POST_SURVEY_COLUMNS = {
+    'stress': 'stress',
+    'wantAIHelp': 'want_ai_help',
+    'helpfulness': 'helpfulness',
+    'empathy': 'empathy',
+    'actionability': 'actionability',
+    'intentionToAdopt': 'intention_to_adopt',
+}
 
 
 def safe_json_parse(json_string):
@@ -27,11 +88,22 @@ def safe_json_parse(json_string):
     dict : Parsed JSON or empty dict
     """
     try:
-        return json.loads(json_string)
+        return _json_loads(json_string)
     except (json.JSONDecodeError, TypeError):
         return {}
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_json_cached(json_string):
+    """
+    Cached safe_json_parse for questionnaire columns.
+
+    A participant's pre-questionnaire is repeated on every case row, so identical
+    strings are parsed once. The returned dict is shared and must not be mutated.
+    """
+    return safe_json_parse(json_string)
+
+
 def calculate_self_efficacy_composite(questions_dict, prefix):
     """
     Calculate self-efficacy composite score from individual items.
@@ -47,14 +119,20 @@ def calculate_self_efficacy_composite(questions_dict, prefix):
     --------
     float : Composite self-efficacy score (mean of valid items)
     """
-    se_items = [
-        questions_dict.get(f'{prefix}{i}') for i in SELF_EFFICACY_ITEMS
-    ]
+    keys = (SE_KEYS_QUESTIONNAIRE if prefix == 'selfEfficacy'
+            else [f'{prefix}{i}' for i in SELF_EFFICACY_ITEMS])
+    se_items = [questions_dict.get(key) for key in keys]
 
-    # Filter out None values and calculate mean
+    return _mean_of_answered_items(se_items)
+
+
+def _mean_of_answered_items(se_items):
+    """Mean of the answered (non-None) items, NaN if none were answered."""
     se_valid = [x for x in se_items if x is not None]
 
-    return np.mean(se_valid) if se_valid else np.nan
+    # Plain sum/len: np.mean's array overhead dominates on at most seven items
+    n = len(se_valid)
+    return sum(se_valid) / n if n else np.nan
 
 
 def process_participant_row(row):
@@ -73,16 +151,16 @@ def process_participant_row(row):
     pre_questions = safe_json_parse(row['Pre Questions'])
     post_questions = safe_json_parse(row['Post Questions'])
 
+    # Look up each self-efficacy item once and reuse it for composite and columns
+    pre_items = [pre_questions.get(key) for key in SE_KEYS_QUESTIONNAIRE]
+    post_items = [post_questions.get(key) for key in SE_KEYS_QUESTIONNAIRE]
+
     # Calculate self-efficacy composites
-    pre_se_composite = calculate_self_efficacy_composite(
-        pre_questions, 'selfEfficacy')
-    post_se_composite = calculate_self_efficacy_composite(
-        post_questions, 'selfEfficacy')
+    pre_se_composite = _mean_of_answered_items(pre_items)
+    post_se_composite = _mean_of_answered_items(post_items)
 
-    # Calculate change score
-    se_change = (post_se_composite - pre_se_composite
-                 if not np.isnan(pre_se_composite) and not np.isnan(post_se_composite)
-                 else np.nan)
+    # Calculate change score (NaN propagates if either composite is missing)
+    se_change = post_se_composite - pre_se_composite
 
     processed_row = {
         'participant_id': row['ID'],
@@ -100,8 +178,8 @@ def process_participant_row(row):
         'self_efficacy_change': se_change,
 
         # Individual self-efficacy items (for detailed analysis)
-        **{f'pre_se_{i}': pre_questions.get(f'selfEfficacy{i}') for i in SELF_EFFICACY_ITEMS},
-        **{f'post_se_{i}': post_questions.get(f'selfEfficacy{i}') for i in SELF_EFFICACY_ITEMS},
+        **dict(zip(SE_KEYS_PRE, pre_items)),
+        **dict(zip(SE_KEYS_POST, post_items)),
 
         # Case-level measures
         'pre_confidence': row['Pre Confidence'],
@@ -120,6 +198,72 @@ def process_participant_row(row):
     return processed_row
 
 
+def parse_questions_column(json_column):
+    """
+    Parse a column of questionnaire JSON strings into a flat DataFrame.
+
+    Parameters:
+    -----------
+    json_column : pandas.Series
+        Raw JSON strings, one questionnaire per row
+
+    Returns:
+    --------
+    pandas.DataFrame : One column per questionnaire key, aligned to the input index
+    """
+    # Missing cells are filtered out up front instead of failing inside the parser
+    values = json_column.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    parsed = np.fromiter(
+        (_EMPTY_QUESTIONS if is_missing else _parse_json_cached(s)
+         for s, is_missing in zip(values, missing)),
+        dtype=object, count=len(values)
+    )
+    parsed = pd.json_normalize(parsed)
+    parsed.index = json_column.index
+    return parsed
+
+
+def process_case_data(raw_data):
+    """
+    Process all raw case rows at once using vectorized column operations.
+
+    Produces the same columns as applying process_participant_row to every row.
+
+    Parameters:
+    -----------
+    raw_data : pandas.DataFrame
+        Raw study data with one row per participant-case combination
+
+    Returns:
+    --------
+    pandas.DataFrame : Case-level processed data
+    """
+    pre_questions = parse_questions_column(raw_data['Pre Questions'])
+    post_questions = parse_questions_column(raw_data['Post Questions'])
+
+    pre_items = pre_questions.reindex(columns=list(SE_KEYS_QUESTIONNAIRE))
+    post_items = post_questions.reindex(columns=list(SE_KEYS_QUESTIONNAIRE))
+
+    # Composites are the mean of the answered items; NaN propagates into the change
+    pre_se_composite = pre_items.mean(axis=1)
+    post_se_composite = post_items.mean(axis=1)
+
+    survey = post_questions.reindex(columns=list(POST_SURVEY_COLUMNS))
+
+    # Collect the output columns in order and build the frame in one call
+    columns = {new: raw_data[old] for old, new in CASE_INFO_COLUMNS.items()}
+    columns['pre_self_efficacy'] = pre_se_composite
+    columns['post_self_efficacy'] = post_se_composite
+    columns['self_efficacy_change'] = post_se_composite - pre_se_composite
+    columns.update(zip(SE_KEYS_PRE, (pre_items[key] for key in SE_KEYS_QUESTIONNAIRE)))
+    columns.update(zip(SE_KEYS_POST, (post_items[key] for key in SE_KEYS_QUESTIONNAIRE)))
+    columns.update({new: raw_data[old] for old, new in CASE_MEASURE_COLUMNS.items()})
+    columns.update({new: survey[old] for old, new in POST_SURVEY_COLUMNS.items()})
+
+    return pd.DataFrame(columns, copy=False)
+
+
 def create_participant_summary(processed_data):
     """
     Create participant-level summary from case-level data.
@@ -133,91 +277,121 @@ def create_participant_summary(processed_data):
     --------
     pandas.DataFrame : Participant-level summary data
     """
-    participant_data = []
-
-    # Self-efficacy dimension labels for better interpretability
-    se_dimension_labels = {
-        1: 'relevant',
-        2: 'complete',
-        3: 'helpful',
-        4: 'accurate',
-        5: 'appropriate',
-        6: 'clear',
-        7: 'empathetic'
+    grouped = processed_data.groupby('participant_id', sort=False)
+
+    # Demographics, baseline and post-study survey answers come from the first case
+    first_cases = grouped.head(1).set_index('participant_id')
+
+    # Case-varying measures are averaged across cases (NaN values are skipped)
+    case_means = grouped[['post_self_efficacy', 'post_stress', 'time_taken',
+                          *SE_KEYS_PRE, *SE_KEYS_POST]].mean()
+
+    columns = {
+        'branch': first_cases['branch'],
+        'group': pd.Categorical.from_codes(
+            (first_cases['branch'].to_numpy() != 'branch-a').astype(np.int8),
+            categories=GROUP_CATEGORIES
+        ),
+        'age': first_cases['age'],
+        'education': first_cases['education'],
+        'ethnicity': first_cases['ethnicity'],
+
+        # Pre-intervention measures (should be same across cases)
+        'pre_self_efficacy': first_cases['pre_self_efficacy'],
+
+        # Post-intervention measures (averaged across cases)
+        'post_self_efficacy': case_means['post_self_efficacy'],
+        'post_stress': case_means['post_stress'],
+        'avg_time_taken': case_means['time_taken'],
+
+        # Intervention-specific (from post-study survey)
+        'stress': first_cases['stress'],
+        'want_ai_help': first_cases['want_ai_help'],
+        'helpfulness': first_cases['helpfulness'],
+        'empathy': first_cases['empathy'],
+        'actionability': first_cases['actionability'],
+        'intention_to_adopt': first_cases['intention_to_adopt'],
+
+        'cases_completed': grouped.size()
     }
 
-    for participant_id in processed_data['participant_id'].unique():
-        participant_cases = processed_data[processed_data['participant_id']
-                                           == participant_id]
-        first_case = participant_cases.iloc[0]
-
-        # Participant demographics (same across cases)
-        participant_row = {
-            'participant_id': participant_id,
-            'branch': first_case['branch'],
-            'group': 'AI' if first_case['branch'] == 'branch-a' else 'Control',
-            'age': first_case['age'],
-            'education': first_case['education'],
-            'ethnicity': first_case['ethnicity'],
-
-            # Pre-intervention measures (should be same across cases)
-            'pre_self_efficacy': first_case['pre_self_efficacy'],
-
-            # Post-intervention measures (averaged across cases)
-            'post_self_efficacy': participant_cases['post_self_efficacy'].mean(),
-            'post_stress': participant_cases['post_stress'].mean(),
-            'avg_time_taken': participant_cases['time_taken'].mean(),
-
-            # Intervention-specific (from post-study survey)
-            'stress': first_case['stress'],
-            'want_ai_help': first_case['want_ai_help'],
-            'helpfulness': first_case['helpfulness'],
-            'empathy': first_case['empathy'],
-            'actionability': first_case['actionability'],
-            'intention_to_adopt': first_case['intention_to_adopt'],
-
-            'cases_completed': len(participant_cases)
-        }
-
-        # Calculate individual self-efficacy dimensions (mean across cases for each participant)
-        for dimension in SELF_EFFICACY_ITEMS:
-            label = se_dimension_labels[dimension]
-
-            # Pre-intervention scores (average across cases - should be similar)
-            pre_col = f'pre_se_{dimension}'
-            post_col = f'post_se_{dimension}'
-
-            pre_scores = participant_cases[pre_col].dropna()
-            post_scores = participant_cases[post_col].dropna()
-
-            if len(pre_scores) > 0:
-                participant_row[f'pre_se_{label}'] = pre_scores.mean()
-            else:
-                participant_row[f'pre_se_{label}'] = np.nan
-
-            if len(post_scores) > 0:
-                participant_row[f'post_se_{label}'] = post_scores.mean()
-            else:
-                participant_row[f'post_se_{label}'] = np.nan
-
-            # Calculate change scores for each dimension
-            if not np.isnan(participant_row[f'pre_se_{label}']) and not np.isnan(participant_row[f'post_se_{label}']):
-                participant_row[f'se_change_{label}'] = (
-                    participant_row[f'post_se_{label}'] -
-                    participant_row[f'pre_se_{label}']
-                )
-            else:
-                participant_row[f'se_change_{label}'] = np.nan
-
-        # Calculate overall change score (for backward compatibility)
-        participant_row['self_efficacy_change'] = (
-            participant_row['post_self_efficacy'] -
-            participant_row['pre_self_efficacy']
-        )
-
-        participant_data.append(participant_row)
-
-    return pd.DataFrame(participant_data)
+    # Individual self-efficacy dimensions (mean across cases for each participant),
+    # handled as (participants x dimensions) blocks with one vectorized subtraction
+    pre_block = case_means[list(SE_KEYS_PRE)].to_numpy()
+    post_block = case_means[list(SE_KEYS_POST)].to_numpy()
+    change_block = post_block - pre_block
+
+    # Interleave as pre/post/change per dimension to keep the column layout
+    dimension_block = np.stack([pre_block, post_block, change_block], axis=2)
+    dimension_columns = [
+        f'{prefix}_{SELF_EFFICACY_DIMENSIONS[dimension]}'
+        for dimension in SELF_EFFICACY_ITEMS
+        for prefix in ('pre_se', 'post_se', 'se_change')
+    ]
+    columns.update(zip(dimension_columns,
+                       dimension_block.reshape(len(case_means), -1).T))
+
+    # Calculate overall change score (for backward compatibility)
+    columns['self_efficacy_change'] = (
+        columns['post_self_efficacy'] - columns['pre_self_efficacy']
+    )
+
+    participant_data = pd.DataFrame(columns, index=case_means.index, copy=False)
+    return participant_data.reset_index()
+
+
+def load_raw_data(file_path=DEFAULT_DATA_FILE):
+    """
+    Load the raw study data from CSV file.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the CSV file
+
+    Returns:
+    --------
+    pandas.DataFrame : Raw data with one row per participant-case combination
+    """
+    return pd.read_csv(file_path, usecols=RAW_DATA_COLUMNS,
+                       dtype=RAW_DATA_DTYPES)
+
+
+@dataclass
+class DataBundle:
+    """
+    Study data that is processed on demand.
+
+    Only the raw CSV is held up front; the case-level and participant-level
+    frames are built the first time they are accessed and then cached.
+    """
+    raw: pd.DataFrame
+
+    @functools.cached_property
+    def cases(self):
+        """pandas.DataFrame : Case-level processed data."""
+        return process_case_data(self.raw)
+
+    @functools.cached_property
+    def participants(self):
+        """pandas.DataFrame : Participant-level summary data."""
+        return create_participant_summary(self.cases)
+
+
+def load_data_bundle(file_path=DEFAULT_DATA_FILE):
+    """
+    Load the study data without processing it yet.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the CSV file
+
+    Returns:
+    --------
+    DataBundle : Raw data with lazily computed case and participant frames
+    """
+    return DataBundle(load_raw_data(file_path))
 
 
 def load_and_process_data(file_path=DEFAULT_DATA_FILE):
@@ -235,19 +409,11 @@ def load_and_process_data(file_path=DEFAULT_DATA_FILE):
     """
     print("🔄 Loading and processing data...")
 
-    # Load raw data
-    raw_data = pd.read_csv(file_path)
+    bundle = load_data_bundle(file_path)
 
-    # Process each row
-    processed_rows = []
-    for _, row in raw_data.iterrows():
-        processed_rows.append(process_participant_row(row))
-
-    # Create processed DataFrame
-    processed_data = pd.DataFrame(processed_rows)
-
-    # Create participant-level data (aggregating across cases)
-    participant_data = create_participant_summary(processed_data)
+    raw_data = bundle.raw
+    processed_data = bundle.cases
+    participant_data = bundle.participants
 
     print(f"✅ Data loaded successfully!")
     print(
@@ -275,12 +441,20 @@ def add_demographic_groups(data):
     --------
     pandas.DataFrame : Data with added demographic groups
     """
-    from config import AGE_BINS, AGE_LABELS
+    from config import AGE_BINS_NP, AGE_LABELS, AGE_GROUP_LUT
 
     data = data.copy()
 
-    # Age groups
-    data['age_group'] = pd.cut(data['age'], bins=AGE_BINS, labels=AGE_LABELS)
+    # Age groups: whole ages are a table lookup; fractional, missing or
+    # out-of-range ages fall back to pd.cut
+    ages = data['age']
+    if (pd.api.types.is_integer_dtype(ages) and not ages.hasnans
+            and ages.between(0, len(AGE_GROUP_LUT) - 1).all()):
+        codes = AGE_GROUP_LUT[ages.to_numpy(dtype=np.intp)]
+        data['age_group'] = pd.Categorical.from_codes(
+            codes, categories=AGE_LABELS, ordered=True)
+    else:
+        data['age_group'] = pd.cut(ages, bins=AGE_BINS_NP, labels=AGE_LABELS)
 
     return data
 
@@ -291,17 +465,21 @@ def get_self_efficacy_dimensions():
 
     Returns:
     --------
-    dict : Mapping of dimension number to label
-    """
-    return {
-        1: 'relevant',
-        2: 'complete',
-        3: 'helpful',
-        4: 'accurate',
-        5: 'appropriate',
-        6: 'clear',
-        7: 'empathetic'
-    }
+    mappingproxy : Read-only mapping of dimension number to label
+    """
+    return SELF_EFFICACY_DIMENSIONS
+
+
+@functools.lru_cache(maxsize=None)
+def _get_statistical_test_runners():
+    """
+    Import run_statistical_tests and run_statistical_tests_columns on first
+    use and reuse them afterwards.
+
+    Deferring the import keeps scipy out of data_processing's import time.
+    """
+    from statistical_analysis import run_statistical_tests, run_statistical_tests_columns
+    return run_statistical_tests, run_statistical_tests_columns
 
 
 def analyze_self_efficacy_dimensions(participant_data):
@@ -317,22 +495,29 @@ def analyze_self_efficacy_dimensions(participant_data):
     --------
     dict : Analysis results for each dimension
     """
-    from statistical_analysis import run_statistical_tests, calculate_descriptive_stats
+    run_statistical_tests, run_statistical_tests_columns = _get_statistical_test_runners()
 
     dimensions = get_self_efficacy_dimensions()
     dimension_results = {}
 
+    # All dimensions share one stacked t-test / Mann-Whitney call
+    change_cols = [f'se_change_{dimension_label}' for dimension_label in dimensions.values()
+                   if f'se_change_{dimension_label}' in participant_data.columns]
+    batched = run_statistical_tests_columns(participant_data, change_cols, group_col='group')
+
     for dimension_num, dimension_label in dimensions.items():
         change_col = f'se_change_{dimension_label}'
 
         if change_col in participant_data.columns:
             # Run statistical tests for this dimension
             try:
-                results = run_statistical_tests(
-                    participant_data,
-                    group_col='group',
-                    measure_col=change_col
-                )
+                results = batched.get(change_col)
+                if results is None:
+                    results = run_statistical_tests(
+                        participant_data,
+                        group_col='group',
+                        measure_col=change_col
+                    )
                 results['dimension_label'] = dimension_label
                 results['dimension_number'] = dimension_num
                 dimension_results[dimension_label] = results
@@ -360,37 +545,41 @@ def get_dimension_summary_stats(participant_data):
     pandas.DataFrame : Summary statistics for each dimension
     """
     dimensions = get_self_efficacy_dimensions()
-    summary_data = []
-
-    for dimension_num, dimension_label in dimensions.items():
-        change_col = f'se_change_{dimension_label}'
-        pre_col = f'pre_se_{dimension_label}'
-        post_col = f'post_se_{dimension_label}'
-
-        if change_col in participant_data.columns:
-            for group in ['AI', 'Control']:
-                group_data = participant_data[participant_data['group'] == group]
-
-                if len(group_data) > 0:
-                    pre_scores = group_data[pre_col].dropna()
-                    post_scores = group_data[post_col].dropna()
-                    change_scores = group_data[change_col].dropna()
-
-                    summary_data.append({
-                        'dimension': dimension_label,
-                        'dimension_number': dimension_num,
-                        'group': group,
-                        'n': len(change_scores),
-                        'pre_mean': pre_scores.mean() if len(pre_scores) > 0 else np.nan,
-                        'pre_std': pre_scores.std() if len(pre_scores) > 0 else np.nan,
-                        'post_mean': post_scores.mean() if len(post_scores) > 0 else np.nan,
-                        'post_std': post_scores.std() if len(post_scores) > 0 else np.nan,
-                        'change_mean': change_scores.mean() if len(change_scores) > 0 else np.nan,
-                        'change_std': change_scores.std() if len(change_scores) > 0 else np.nan,
-                        'change_median': change_scores.median() if len(change_scores) > 0 else np.nan
-                    })
-
-    return pd.DataFrame(summary_data)
+    present = [(dimension_num, dimension_label)
+               for dimension_num, dimension_label in dimensions.items()
+               if f'se_change_{dimension_label}' in participant_data.columns]
+    if not present:
+        return pd.DataFrame()
+
+    # Pre, post and change columns for every dimension, aggregated in one pass
+    stat_cols = [f'{prefix}_{dimension_label}'
+                 for _, dimension_label in present
+                 for prefix in ('pre_se', 'post_se', 'se_change')]
+    stats = participant_data.groupby('group', sort=False, observed=True)[stat_cols].agg(
+        ['mean', 'std', 'median', 'count'])
+
+    groups = [group for group in ['AI', 'Control'] if group in stats.index]
+    if not groups:
+        return pd.DataFrame()
+
+    # Columns are ordered (dimension, pre/post/change, statistic), so the block
+    # reshapes directly into dimensions x groups x measures x statistics
+    values = stats.loc[groups].to_numpy(dtype=float).reshape(
+        len(groups), len(present), 3, 4).transpose(1, 0, 2, 3)
+
+    return pd.DataFrame({
+        'dimension': np.repeat([label for _, label in present], len(groups)),
+        'dimension_number': np.repeat([num for num, _ in present], len(groups)),
+        'group': np.tile(groups, len(present)),
+        'n': values[:, :, 2, 3].ravel().astype(int),
+        'pre_mean': values[:, :, 0, 0].ravel(),
+        'pre_std': values[:, :, 0, 1].ravel(),
+        'post_mean': values[:, :, 1, 0].ravel(),
+        'post_std': values[:, :, 1, 1].ravel(),
+        'change_mean': values[:, :, 2, 0].ravel(),
+        'change_std': values[:, :, 2, 1].ravel(),
+        'change_median': values[:, :, 2, 2].ravel()
+    })
 
 
 def get_data_summary(participant_data, case_data):
@@ -8,15 +8,163 @@ Contains functions for exporting tables, creating reports, and generating
 publication-ready content.
 """
 
+import io
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 from config import OUTPUT_FILES, STUDY_INFO
-from statistical_analysis import (
-    run_statistical_tests, interpret_effect_size,
-    calculate_descriptive_stats
-)
+from statistical_analysis import run_statistical_tests, interpret_effect_size, interpret_effect_sizes
+
+# Use bottleneck's NaN-aware reductions when installed
+try:
+    import bottleneck as bn
+    _nanmean = bn.nanmean
+    _nanstd = bn.nanstd
+except ImportError:
+    _nanmean = np.nanmean
+    _nanstd = np.nanstd
+
+
+# Participant columns read by the tables and report texts
+REPORT_COLUMNS = [
+    'group', 'age', 'education', 'ethnicity', 'self_efficacy_change', 'post_stress'
+]
+
+
+def select_report_columns(participant_data):
+    """
+    Project participant data onto the columns the exports read.
+
+    Parameters:
+    -----------
+    participant_data : pandas.DataFrame
+        Participant-level dataset
+
+    Returns:
+    --------
+    pandas.DataFrame : REPORT_COLUMNS and se_change_* columns that are present
+    """
+    columns = [col for col in participant_data.columns
+               if col in REPORT_COLUMNS or col.startswith('se_change_')]
+    return participant_data[columns]
+
+
+def output_paths(output_dir='.'):
+    """
+    Build the path of every OUTPUT_FILES entry under one output directory.
+
+    Parameters:
+    -----------
+    output_dir : str or Path
+        Directory the files are written to
+
+    Returns:
+    --------
+    dict : OUTPUT_FILES key -> pathlib.Path
+    """
+    out = Path(output_dir)
+    return {key: out / name for key, name in OUTPUT_FILES.items()}
+
+
+def _write_files(path_to_content):
+    """
+    Write each text to its path as UTF-8 in a single buffered binary write.
+
+    Parameters:
+    -----------
+    path_to_content : dict
+        Output path -> text content
+    """
+    for path, content in path_to_content.items():
+        with open(path, 'wb', buffering=1 << 20) as f:
+            f.write(content.encode('utf-8'))
+
+
+def _group_mean_sd(values):
+    """Mean and sample SD of a float array, skipping NaN (NaN when undefined)."""
+    n = np.count_nonzero(~np.isnan(values))
+    mean = _nanmean(values) if n > 0 else np.nan
+    sd = _nanstd(values, ddof=1) if n > 1 else np.nan
+    return {'mean': mean, 'sd': sd}
+
+
+def compute_report_results(participant_data, se_results=None, stress_results=None):
+    """
+    Run the key outcome tests once so the report builders can share them.
+
+    Parameters:
+    -----------
+    participant_data : pandas.DataFrame
+        Participant-level dataset
+    se_results : dict
+        Existing run_statistical_tests result for self_efficacy_change (optional)
+    stress_results : dict
+        Existing run_statistical_tests result for post_stress (optional)
+
+    Returns:
+    --------
+    dict : 'se_results', 'stress_results' (None without post_stress),
+        'se_label', 'stress_label' (effect size interpretations),
+        'ai_idx', 'control_idx' (row positions of each group) and
+        'group_stats' (group -> column -> mean/SD of the reported measures)
+    """
+    # Tests the caller already ran are reused; only missing ones are run here
+    if se_results is None:
+        se_results = run_statistical_tests(
+            participant_data, measure_col='self_efficacy_change')
+    if stress_results is None and 'post_stress' in participant_data.columns:
+        stress_results = run_statistical_tests(
+            participant_data, measure_col='post_stress')
+
+    # Group masks are built once; categorical codes make the comparisons cheap
+    group = participant_data['group']
+    if not isinstance(group.dtype, pd.CategoricalDtype):
+        group = group.astype('category')
+    # Row positions instead of sub-frames: the reports only need group sizes
+    # and a few column reductions, so no filtered DataFrame copy is built
+    ai_idx = np.flatnonzero((group == 'AI').to_numpy())
+    control_idx = np.flatnonzero((group == 'Control').to_numpy())
+
+    # Means and SDs quoted in the report texts, computed once per group
+    group_stats = {'AI': {}, 'Control': {}}
+    available = set(participant_data.columns)
+    for col in ['age', 'self_efficacy_change', 'post_stress']:
+        if col in available:
+            values = participant_data[col].to_numpy(dtype=float)
+            group_stats['AI'][col] = _group_mean_sd(values[ai_idx])
+            group_stats['Control'][col] = _group_mean_sd(values[control_idx])
+
+    return {
+        'se_results': se_results,
+        'stress_results': stress_results,
+        # Each effect size is classified once and quoted by several texts
+        'se_label': interpret_effect_size(se_results['effect_size']),
+        'stress_label': (interpret_effect_size(stress_results['effect_size'])
+                         if stress_results is not None else None),
+        'ai_idx': ai_idx,
+        'control_idx': control_idx,
+        'group_stats': group_stats,
+    }
+
+
+def _column_mean_sd(values):
+    """Per-column count, mean and sample SD of a 2-D float array, skipping NaN."""
+    valid = ~np.isnan(values)
+    n = valid.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(valid, values, 0.0).sum(axis=0) / n
+        squared_dev = np.where(valid, values - mean, 0.0) ** 2
+        sd = np.sqrt(squared_dev.sum(axis=0) / (n - 1))
+    return n, mean, sd
+
+
+def _format_fixed(values, valid=True, decimals=3):
+    """Format a column of numbers to fixed decimals, 'N/A' where not valid."""
+    formatted = np.char.mod(f'%.{decimals}f', np.asarray(values, dtype=float))
+    return np.where(valid, formatted, 'N/A').astype(object)
 
 
 def create_dimensional_analysis_table(dimension_results, participant_data):
@@ -37,56 +185,51 @@ def create_dimensional_analysis_table(dimension_results, participant_data):
     from data_processing import get_self_efficacy_dimensions
 
     dimensions = get_self_efficacy_dimensions()
-    table_data = []
-
-    for dimension_num, dimension_label in dimensions.items():
-        change_col = f'se_change_{dimension_label}'
-
-        if change_col in participant_data.columns:
-            # Get descriptive statistics for each group
-            ai_data = participant_data[participant_data['group']
-                                       == 'AI'][change_col].dropna()
-            control_data = participant_data[participant_data['group']
-                                            == 'Control'][change_col].dropna()
-
-            # Get statistical test results
-            results = dimension_results.get(dimension_label, {})
-
-            if 'error' not in results:
-                effect_size = results.get('effect_size', np.nan)
-                p_value = results.get('recommended_p', np.nan)
-                effect_interpretation = interpret_effect_size(
-                    effect_size) if not np.isnan(effect_size) else 'N/A'
-
-                table_data.append({
-                    'Dimension': dimension_label.title(),
-                    'AI_N': len(ai_data),
-                    'AI_Mean': f"{ai_data.mean():.3f}" if len(ai_data) > 0 else 'N/A',
-                    'AI_SD': f"{ai_data.std():.3f}" if len(ai_data) > 0 else 'N/A',
-                    'Control_N': len(control_data),
-                    'Control_Mean': f"{control_data.mean():.3f}" if len(control_data) > 0 else 'N/A',
-                    'Control_SD': f"{control_data.std():.3f}" if len(control_data) > 0 else 'N/A',
-                    'Effect_Size': f"{effect_size:.3f}" if not np.isnan(effect_size) else 'N/A',
-                    'Effect_Interpretation': effect_interpretation,
-                    'P_Value': f"{p_value:.3f}" if not np.isnan(p_value) else 'N/A',
-                    'Significant': '✓' if p_value < 0.05 else '✗' if not np.isnan(p_value) else 'N/A'
-                })
-            else:
-                table_data.append({
-                    'Dimension': dimension_label.title(),
-                    'AI_N': len(ai_data),
-                    'AI_Mean': 'Error',
-                    'AI_SD': 'Error',
-                    'Control_N': len(control_data),
-                    'Control_Mean': 'Error',
-                    'Control_SD': 'Error',
-                    'Effect_Size': 'Error',
-                    'Effect_Interpretation': 'Error',
-                    'P_Value': 'Error',
-                    'Significant': 'Error'
-                })
-
-    return pd.DataFrame(table_data)
+    available = set(participant_data.columns)
+    labels = [label for label in dimensions.values()
+              if f'se_change_{label}' in available]
+    if not labels:
+        return pd.DataFrame()
+    change_cols = [f'se_change_{label}' for label in labels]
+
+    # Descriptives for every dimension at once on the (participants x dimensions)
+    # array; a group with no rows gets n=0
+    values = participant_data[change_cols].to_numpy(dtype=float)
+    group = participant_data['group']
+    ai_n, ai_mean, ai_sd = _column_mean_sd(values[(group == 'AI').to_numpy()])
+    control_n, control_mean, control_sd = _column_mean_sd(
+        values[(group == 'Control').to_numpy()])
+    has_ai, has_control = ai_n > 0, control_n > 0
+
+    # Statistical test results, one entry per dimension
+    results = [dimension_results.get(label, {}) for label in labels]
+    failed = np.array(['error' in result for result in results])
+    effect_sizes = np.array([result.get('effect_size', np.nan) for result in results],
+                            dtype=float)
+    p_values = np.array([result.get('recommended_p', np.nan) for result in results],
+                        dtype=float)
+
+    table = pd.DataFrame({
+        'Dimension': [label.title() for label in labels],
+        'AI_N': ai_n,
+        'AI_Mean': _format_fixed(ai_mean, has_ai),
+        'AI_SD': _format_fixed(ai_sd, has_ai),
+        'Control_N': control_n,
+        'Control_Mean': _format_fixed(control_mean, has_control),
+        'Control_SD': _format_fixed(control_sd, has_control),
+        'Effect_Size': _format_fixed(effect_sizes, ~np.isnan(effect_sizes)),
+        'Effect_Interpretation': np.where(np.isnan(effect_sizes), 'N/A',
+                                          interpret_effect_sizes(effect_sizes)),
+        'P_Value': _format_fixed(p_values, ~np.isnan(p_values)),
+        'Significant': np.where(np.isnan(p_values), 'N/A',
+                                np.where(p_values < 0.05, '✓', '✗')),
+    })
+
+    # Dimensions whose tests failed keep their Ns but report 'Error' elsewhere
+    error_cols = table.columns.drop(['Dimension', 'AI_N', 'Control_N'])
+    table.loc[failed, error_cols] = 'Error'
+
+    return table
 
 
 def create_descriptive_table(data, group_col='group', measures=None):
@@ -109,28 +252,31 @@ def create_descriptive_table(data, group_col='group', measures=None):
     if measures is None:
         measures = ['self_efficacy_change', 'post_stress']
 
-    table_data = []
-
-    for measure in measures:
-        # Skip if measure not in data
-        if measure not in data.columns:
-            continue
-
-        stats = calculate_descriptive_stats(data, group_col, measure)
-
-        for group in stats.index:
-            row = {
-                'Measure': measure.replace('_', ' ').title(),
-                'Group': group,
-                'N': int(stats.loc[group, 'n']),
-                'Mean': f"{stats.loc[group, 'mean']:.3f}",
-                'SD': f"{stats.loc[group, 'std']:.3f}",
-                'Median': f"{stats.loc[group, 'median']:.3f}",
-                'Range': f"[{stats.loc[group, 'min']:.2f}, {stats.loc[group, 'max']:.2f}]"
-            }
-            table_data.append(row)
-
-    return pd.DataFrame(table_data)
+    # Skip measures not in data
+    available = set(data.columns)
+    present = [measure for measure in measures if measure in available]
+    if not present:
+        return pd.DataFrame()
+
+    # All measures and groups in one grouped pass, groups in order of appearance
+    stats = data.groupby(group_col, sort=False, observed=True)[present].agg(
+        ['count', 'mean', 'std', 'median', 'min', 'max'])
+
+    # One row per measure and group; numbers are formatted a whole column at a time
+    long_stats = pd.concat([stats[measure] for measure in present], keys=present)
+    ranges = ('[' + _format_fixed(long_stats['min'], decimals=2) + ', '
+              + _format_fixed(long_stats['max'], decimals=2) + ']')
+
+    return pd.DataFrame({
+        'Measure': [measure.replace('_', ' ').title()
+                    for measure in long_stats.index.get_level_values(0)],
+        'Group': list(long_stats.index.get_level_values(1)),
+        'N': long_stats['count'].to_numpy(dtype=int),
+        'Mean': _format_fixed(long_stats['mean']),
+        'SD': _format_fixed(long_stats['std']),
+        'Median': _format_fixed(long_stats['median']),
+        'Range': ranges
+    })
 
 
 def create_demographics_table(data):
@@ -146,46 +292,35 @@ def create_demographics_table(data):
     --------
     tuple : (demo_df, education_counts, ethnicity_counts)
     """
-    demo_stats = []
-
-    # Age statistics
-    for group in ['AI', 'Control']:
-        if group in data['group'].values:
-            group_data = data[data['group'] == group]
-            demo_stats.append({
-                'Variable': 'Age',
-                'Group': group,
-                'n': len(group_data),
-                'Mean (SD)': f"{group_data['age'].mean():.1f} ({group_data['age'].std():.1f})",
-                'Range': f"[{group_data['age'].min()}, {group_data['age'].max()}]"
-            })
-
-    demo_df = pd.DataFrame(demo_stats)
-
-    # Education counts
+    # Age statistics, one grouped pass for both groups
+    age_stats = data.groupby('group', observed=True)['age'].agg(
+        ['size', 'mean', 'std', 'min', 'max'])
+    groups = [group for group in ['AI', 'Control'] if group in age_stats.index]
+    age_stats = age_stats.loc[groups]
+
+    demo_df = pd.DataFrame({
+        'Variable': ['Age'] * len(groups),
+        'Group': groups,
+        'n': age_stats['size'].to_numpy(dtype=int),
+        'Mean (SD)': [f"{mean:.1f} ({sd:.1f})"
+                      for mean, sd in zip(age_stats['mean'], age_stats['std'])],
+        'Range': [f"[{low}, {high}]"
+                  for low, high in zip(age_stats['min'], age_stats['max'])]
+    })
+
+    # Education and ethnicity counts per group
     education_counts = None
     if 'education' in data.columns:
-        try:
-            education_counts = data.groupby(
-                ['group', 'education']).size().unstack(fill_value=0)
-        except ValueError:
-            # Handle case where there might be issues with grouping
-            education_counts = pd.DataFrame()
-
-    # Ethnicity counts
+        education_counts = pd.crosstab(data['group'], data['education'])
+
     ethnicity_counts = None
     if 'ethnicity' in data.columns:
-        try:
-            ethnicity_counts = data.groupby(
-                ['group', 'ethnicity']).size().unstack(fill_value=0)
-        except ValueError:
-            # Handle case where there might be issues with grouping
-            ethnicity_counts = pd.DataFrame()
+        ethnicity_counts = pd.crosstab(data['group'], data['ethnicity'])
 
     return demo_df, education_counts, ethnicity_counts
 
 
-def export_tables_to_latex(participant_data, output_dir='.'):
+def export_tables_to_latex(participant_data, output_dir='.', desc_table=None, demo_df=None):
     """
     Export all tables to LaTeX format.
 
@@ -195,22 +330,27 @@ def export_tables_to_latex(participant_data, output_dir='.'):
         Participant-level dataset
     output_dir : str
         Directory to save LaTeX files
+    desc_table : pandas.DataFrame
+        Prebuilt create_descriptive_table output (built here if omitted)
+    demo_df : pandas.DataFrame
+        Prebuilt demographics table (built here if omitted)
     """
     try:
         # Descriptive statistics table
-        desc_table = create_descriptive_table(participant_data)
-        desc_path = f"{output_dir}/{OUTPUT_FILES['descriptive_table']}"
-
-        with open(desc_path, 'w') as f:
-            f.write(desc_table.to_latex(index=False, escape=False))
+        if desc_table is None:
+            desc_table = create_descriptive_table(participant_data)
+        paths = output_paths(output_dir)
+        desc_path = paths['descriptive_table']
 
         # Demographics table
-        demo_df, edu_counts, eth_counts = create_demographics_table(
-            participant_data)
-        demo_path = f"{output_dir}/{OUTPUT_FILES['demographics_table']}"
+        if demo_df is None:
+            demo_df = create_demographics_table(participant_data)[0]
+        demo_path = paths['demographics_table']
 
-        with open(demo_path, 'w') as f:
-            f.write(demo_df.to_latex(index=False, escape=False))
+        _write_files({
+            desc_path: desc_table.to_latex(index=False, escape=False),
+            demo_path: demo_df.to_latex(index=False, escape=False),
+        })
 
         print("📄 Tables exported to LaTeX format!")
         print(f"   - Descriptive statistics: {desc_path}")
@@ -223,7 +363,7 @@ def export_tables_to_latex(participant_data, output_dir='.'):
         return False
 
 
-def create_results_summary(participant_data, output_dir='.'):
+def create_results_summary(participant_data, output_dir='.', precomputed=None):
     """
     Create a comprehensive summary of all key results.
 
@@ -233,26 +373,30 @@ def create_results_summary(participant_data, output_dir='.'):
         Participant-level dataset
     output_dir : str
         Directory to save summary file
+    precomputed : dict
+        Results from compute_report_results (computed here if omitted)
 
     Returns:
     --------
     str : Summary text
     """
     try:
-        # Run statistical tests for key outcomes
-        se_results = run_statistical_tests(
-            participant_data, measure_col='self_efficacy_change')
-
-        stress_results = None
-        if 'post_stress' in participant_data.columns:
-            stress_results = run_statistical_tests(
-                participant_data, measure_col='post_stress')
+        # Statistical tests for key outcomes
+        if precomputed is None:
+            precomputed = compute_report_results(participant_data)
+        se_results = precomputed['se_results']
+        stress_results = precomputed['stress_results']
+        se_label = precomputed['se_label']
+        stress_label = precomputed['stress_label']
 
         # Generate summary text
-        ai_group = participant_data[participant_data['group'] == 'AI']
-        control_group = participant_data[participant_data['group'] == 'Control']
+        ai_n = len(precomputed['ai_idx'])
+        control_n = len(precomputed['control_idx'])
+        ai_stats = precomputed['group_stats']['AI']
+        control_stats = precomputed['group_stats']['Control']
 
-        summary = f"""
+        summary_buf = io.StringIO()
+        summary_buf.write(f"""
 {STUDY_INFO['title']}
 PILOT STUDY RESULTS SUMMARY
 ===========================
@@ -260,28 +404,28 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 Sample Characteristics:
 - Total participants: {len(participant_data)}
-- AI group: {len(ai_group)}
-- Control group: {len(control_group)}
+- AI group: {ai_n}
+- Control group: {control_n}
 - Completion rate: 100%
 
 Primary Outcome - Self-Efficacy Change:
-- AI group: M = {ai_group['self_efficacy_change'].mean():.3f}, SD = {ai_group['self_efficacy_change'].std():.3f}
-- Control group: M = {control_group['self_efficacy_change'].mean():.3f}, SD = {control_group['self_efficacy_change'].std():.3f}
-- Effect size: d = {se_results['effect_size']:.3f} ({interpret_effect_size(se_results['effect_size'])})
+- AI group: M = {ai_stats['self_efficacy_change']['mean']:.3f}, SD = {ai_stats['self_efficacy_change']['sd']:.3f}
+- Control group: M = {control_stats['self_efficacy_change']['mean']:.3f}, SD = {control_stats['self_efficacy_change']['sd']:.3f}
+- Effect size: d = {se_results['effect_size']:.3f} ({se_label})
 - Statistical test: t = {se_results['t_test']['statistic']:.3f}, p = {se_results['t_test']['p_value']:.3f}
 - Significant: {'Yes' if se_results['t_test']['significant'] else 'No'}
-"""
+""")
 
         # Add stress results if available
         if stress_results and 'post_stress' in participant_data.columns:
-            summary += f"""
+            summary_buf.write(f"""
 Secondary Outcome - Post-Intervention Stress:
-- AI group: M = {ai_group['post_stress'].mean():.3f}, SD = {ai_group['post_stress'].std():.3f}
-- Control group: M = {control_group['post_stress'].mean():.3f}, SD = {control_group['post_stress'].std():.3f}
-- Effect size: d = {stress_results['effect_size']:.3f} ({interpret_effect_size(stress_results['effect_size'])})
+- AI group: M = {ai_stats['post_stress']['mean']:.3f}, SD = {ai_stats['post_stress']['sd']:.3f}
+- Control group: M = {control_stats['post_stress']['mean']:.3f}, SD = {control_stats['post_stress']['sd']:.3f}
+- Effect size: d = {stress_results['effect_size']:.3f} ({stress_label})
 - Statistical test: t = {stress_results['t_test']['statistic']:.3f}, p = {stress_results['t_test']['p_value']:.3f}
 - Significant: {'Yes' if stress_results['t_test']['significant'] else 'No'}
-"""
+""")
 
         # Add interpretation
         max_effect_size = abs(se_results['effect_size'])
@@ -289,21 +433,22 @@ Secondary Outcome - Post-Intervention Stress:
             max_effect_size = max(max_effect_size, abs(
                 stress_results['effect_size']))
 
-        summary += f"""
+        summary_buf.write(f"""
 Interpretation:
 - Feasibility: Excellent (100% completion, balanced groups)
-- Self-efficacy findings: {interpret_effect_size(se_results['effect_size']).lower()} effect size
-"""
+- Self-efficacy findings: {se_label.lower()} effect size
+""")
 
         if stress_results:
-            summary += f"- Stress findings: {interpret_effect_size(stress_results['effect_size']).lower()} effect size\n"
+            summary_buf.write(f"- Stress findings: {stress_label.lower()} effect size\n")
+
+        summary_buf.write(f"- Recommendation: {'Proceed with full study' if max_effect_size > 0.2 else 'Consider protocol modifications'}\n")
 
-        summary += f"- Recommendation: {'Proceed with full study' if max_effect_size > 0.2 else 'Consider protocol modifications'}\n"
+        summary = summary_buf.getvalue()
 
         # Save to file
-        summary_path = f"{output_dir}/{OUTPUT_FILES['results_summary']}"
-        with open(summary_path, 'w') as f:
-            f.write(summary)
+        summary_path = output_paths(output_dir)['results_summary']
+        _write_files({summary_path: summary})
 
         print(f"📋 Results summary saved: {summary_path}")
 
@@ -314,7 +459,7 @@ Interpretation:
         return ""
 
 
-def create_methods_section(participant_data):
+def create_methods_section(participant_data, precomputed=None):
     """
     Generate methods section text for publication.
 
@@ -322,18 +467,24 @@ def create_methods_section(participant_data):
     -----------
     participant_data : pandas.DataFrame
         Participant-level dataset
+    precomputed : dict
+        Results from compute_report_results (optional)
 
     Returns:
     --------
     str : Methods section text
     """
-    ai_count = len(participant_data[participant_data['group'] == 'AI'])
-    control_count = len(
-        participant_data[participant_data['group'] == 'Control'])
+    if precomputed is None:
+        ai_count = int((participant_data['group'] == 'AI').sum())
+        control_count = int((participant_data['group'] == 'Control').sum())
+        se_results = run_statistical_tests(
+            participant_data, measure_col='self_efficacy_change')
+    else:
+        ai_count = len(precomputed['ai_idx'])
+        control_count = len(precomputed['control_idx'])
+        se_results = precomputed['se_results']
 
     # Calculate power based on observed effect size
-    se_results = run_statistical_tests(
-        participant_data, measure_col='self_efficacy_change')
     pilot_effect_size = abs(se_results['effect_size'])
 
     methods_text = f"""
@@ -368,7 +519,7 @@ substantial power to detect similar effect sizes.
     return methods_text
 
 
-def create_results_section(participant_data):
+def create_results_section(participant_data, precomputed=None):
     """
     Generate results section text for publication.
 
@@ -376,59 +527,64 @@ def create_results_section(participant_data):
     -----------
     participant_data : pandas.DataFrame
         Participant-level dataset
+    precomputed : dict
+        Results from compute_report_results (computed here if omitted)
 
     Returns:
     --------
     str : Results section text
     """
-    se_results = run_statistical_tests(
-        participant_data, measure_col='self_efficacy_change')
+    if precomputed is None:
+        precomputed = compute_report_results(participant_data)
+    se_results = precomputed['se_results']
 
-    ai_group = participant_data[participant_data['group'] == 'AI']
-    control_group = participant_data[participant_data['group'] == 'Control']
+    ai_n = len(precomputed['ai_idx'])
+    control_n = len(precomputed['control_idx'])
+    ai_stats = precomputed['group_stats']['AI']
+    control_stats = precomputed['group_stats']['Control']
 
-    results_text = f"""
+    results_buf = io.StringIO()
+    results_buf.write(f"""
 RESULTS SECTION TEMPLATE
 ========================
 
 Participant Characteristics:
 All {len(participant_data)} participants completed the study (100% completion rate). 
-The AI group (n={len(ai_group)}) had a mean age of 
-{ai_group['age'].mean():.1f} years (SD = {ai_group['age'].std():.1f}). 
-The control group (n={len(control_group)}) had a mean age of 
-{control_group['age'].mean():.1f} years (SD = {control_group['age'].std():.1f}). 
+The AI group (n={ai_n}) had a mean age of 
+{ai_stats['age']['mean']:.1f} years (SD = {ai_stats['age']['sd']:.1f}). 
+The control group (n={control_n}) had a mean age of 
+{control_stats['age']['mean']:.1f} years (SD = {control_stats['age']['sd']:.1f}). 
 [ADD OTHER DEMOGRAPHIC COMPARISONS]
 
 Primary Outcome - Self-Efficacy Change:
-The AI group showed a mean change of {ai_group['self_efficacy_change'].mean():.3f} 
-(SD = {ai_group['self_efficacy_change'].std():.3f}) while the control group 
-showed a mean change of {control_group['self_efficacy_change'].mean():.3f} 
-(SD = {control_group['self_efficacy_change'].std():.3f}). 
+The AI group showed a mean change of {ai_stats['self_efficacy_change']['mean']:.3f} 
+(SD = {ai_stats['self_efficacy_change']['sd']:.3f}) while the control group 
+showed a mean change of {control_stats['self_efficacy_change']['mean']:.3f} 
+(SD = {control_stats['self_efficacy_change']['sd']:.3f}). 
 This difference was {"" if se_results['t_test']['significant'] else "not "}statistically significant 
 (t = {se_results['t_test']['statistic']:.3f}, p = {se_results['t_test']['p_value']:.3f}, 
 d = {se_results['effect_size']:.3f}).
-"""
+""")
 
     # Add stress results if available
-    if 'post_stress' in participant_data.columns:
-        stress_results = run_statistical_tests(
-            participant_data, measure_col='post_stress')
-
-        results_text += f"""
+    stress_results = precomputed['stress_results']
+    if stress_results is not None:
+        results_buf.write(f"""
 Secondary Outcome - Post-Intervention Stress:
 Post-intervention stress levels were {"lower" if stress_results['effect_size'] < 0 else "higher"} in the AI group 
-(M = {ai_group['post_stress'].mean():.3f}, SD = {ai_group['post_stress'].std():.3f}) 
-compared to the control group (M = {control_group['post_stress'].mean():.3f}, 
-SD = {control_group['post_stress'].std():.3f}). 
+(M = {ai_stats['post_stress']['mean']:.3f}, SD = {ai_stats['post_stress']['sd']:.3f}) 
+compared to the control group (M = {control_stats['post_stress']['mean']:.3f}, 
+SD = {control_stats['post_stress']['sd']:.3f}). 
 This difference was {"" if stress_results['t_test']['significant'] else "not "}statistically significant 
 (t = {stress_results['t_test']['statistic']:.3f}, p = {stress_results['t_test']['p_value']:.3f}, 
 d = {stress_results['effect_size']:.3f}).
-"""
+""")
 
-    return results_text
+    return results_buf.getvalue()
 
 
-def export_publication_materials(participant_data, output_dir='.', dimension_results=None):
+def export_publication_materials(participant_data, output_dir='.', dimension_results=None,
+                                 precomputed=None, desc_table=None):
     """
     Export all publication-ready materials.
 
@@ -440,6 +596,10 @@ def export_publication_materials(participant_data, output_dir='.', dimension_res
         Directory to save files
     dimension_results : dict
         Results from dimensional analysis (optional)
+    precomputed : dict
+        Results from compute_report_results (computed here if omitted)
+    desc_table : pandas.DataFrame
+        Descriptive table already built by the caller (built here if omitted)
 
     Returns:
     --------
@@ -448,61 +608,82 @@ def export_publication_materials(participant_data, output_dir='.', dimension_res
     exported_files = {}
 
     try:
-        # Export LaTeX tables
-        export_tables_to_latex(participant_data, output_dir)
-        exported_files['tables'] = [
-            f"{output_dir}/{OUTPUT_FILES['descriptive_table']}",
-            f"{output_dir}/{OUTPUT_FILES['demographics_table']}"
-        ]
-
-        # Export dimensional analysis table if available
-        if dimension_results:
-            try:
-                dim_table = create_dimensional_analysis_table(
-                    dimension_results, participant_data)
-                dim_path = f"{output_dir}/table_dimensional_analysis.tex"
-
-                # Try to export as LaTeX (requires jinja2)
+        paths = output_paths(output_dir)
+
+        # Later masks and aggregations only touch the columns the exports use
+        participant_data = select_report_columns(participant_data)
+
+        # Run the key outcome tests once for every text builder below
+        if precomputed is None:
+            precomputed = compute_report_results(participant_data)
+
+        # Build each table once; every table is rendered exactly once below
+        if desc_table is None:
+            desc_table = create_descriptive_table(participant_data)
+        demo_df = create_demographics_table(participant_data)[0]
+
+        # Silent builders run in worker threads while the artifacts that
+        # print progress are written here, so the console order is unchanged
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            methods_future = executor.submit(
+                create_methods_section, participant_data, precomputed)
+            results_future = executor.submit(
+                create_results_section, participant_data, precomputed)
+            dim_future = None
+            if dimension_results:
+                dim_future = executor.submit(
+                    create_dimensional_analysis_table, dimension_results, participant_data)
+
+            # Export LaTeX tables
+            export_tables_to_latex(participant_data, output_dir,
+                                   desc_table=desc_table, demo_df=demo_df)
+            exported_files['tables'] = [
+                str(paths['descriptive_table']),
+                str(paths['demographics_table'])
+            ]
+
+            # Export dimensional analysis table if available
+            if dim_future is not None:
                 try:
-                    latex_content = dim_table.to_latex(
-                        index=False,
-                        caption="Self-Efficacy Dimensional Analysis Results",
-                        label="tab:dimensional_analysis",
-                        column_format='l' + 'c' * (len(dim_table.columns) - 1)
-                    )
-                    with open(dim_path, 'w') as f:
-                        f.write(latex_content)
-                    print(f"📁 Saved: {dim_path}")
-                except Exception:
-                    # Fallback to CSV if LaTeX export fails
-                    csv_path = f"{output_dir}/table_dimensional_analysis.csv"
-                    dim_table.to_csv(csv_path, index=False)
-                    print(f"📁 Saved: {csv_path}")
-                    dim_path = csv_path
-
-                exported_files['tables'].append(dim_path)
-
-            except Exception as e:
-                print(
-                    f"Warning: Could not export dimensional analysis table: {e}")
-
-        # Create results summary
-        create_results_summary(participant_data, output_dir)
-        exported_files['summary'] = f"{output_dir}/{OUTPUT_FILES['results_summary']}"
-
-        # Create methods section
-        methods_text = create_methods_section(participant_data)
-        methods_path = f"{output_dir}/methods_section.txt"
-        with open(methods_path, 'w') as f:
-            f.write(methods_text)
-        exported_files['methods'] = methods_path
-
-        # Create results section
-        results_text = create_results_section(participant_data)
-        results_path = f"{output_dir}/results_section.txt"
-        with open(results_path, 'w') as f:
-            f.write(results_text)
-        exported_files['results'] = results_path
+                    dim_table = dim_future.result()
+                    dim_path = paths['dimensional_table']
+
+                    # Try to export as LaTeX (requires jinja2)
+                    try:
+                        latex_content = dim_table.to_latex(
+                            index=False,
+                            caption="Self-Efficacy Dimensional Analysis Results",
+                            label="tab:dimensional_analysis",
+                            column_format='l' + 'c' * (len(dim_table.columns) - 1)
+                        )
+                        _write_files({dim_path: latex_content})
+                        print(f"📁 Saved: {dim_path}")
+                    except Exception:
+                        # Fallback to CSV if LaTeX export fails
+                        csv_path = dim_path.with_suffix('.csv')
+                        dim_table.to_csv(csv_path, index=False)
+                        print(f"📁 Saved: {csv_path}")
+                        dim_path = csv_path
+
+                    exported_files['tables'].append(str(dim_path))
+
+                except Exception as e:
+                    print(
+                        f"Warning: Could not export dimensional analysis table: {e}")
+
+            # Create results summary
+            create_results_summary(participant_data, output_dir, precomputed)
+            exported_files['summary'] = str(paths['results_summary'])
+
+            # Create methods and results sections
+            methods_path = paths['methods_section']
+            results_path = paths['results_section']
+            _write_files({
+                methods_path: methods_future.result(),
+                results_path: results_future.result(),
+            })
+            exported_files['methods'] = str(methods_path)
+            exported_files['results'] = str(results_path)
 
         print("\n✅ All publication materials exported successfully!")
         return exported_files
@@ -530,7 +711,7 @@ def print_file_list(exported_files):
             print(f"- {files}")
 
 
-def create_analysis_report(participant_data, case_data=None, output_dir='.'):
+def create_analysis_report(participant_data, case_data=None, output_dir='.', precomputed=None):
     """
     Create a comprehensive analysis report.
 
@@ -542,16 +723,22 @@ def create_analysis_report(participant_data, case_data=None, output_dir='.'):
         Case-level dataset (optional)
     output_dir : str
         Directory to save report
+    precomputed : dict
+        Results from compute_report_results (computed here if omitted)
 
     Returns:
     --------
     str : Path to generated report
     """
-    report_path = f"{output_dir}/analysis_report.md"
+    report_path = output_paths(output_dir)['analysis_report']
 
     try:
+        if precomputed is None:
+            precomputed = compute_report_results(participant_data)
+
         # Generate report content
-        report_content = f"""# {STUDY_INFO['title']}
+        report_buf = io.StringIO()
+        report_buf.write(f"""# {STUDY_INFO['title']}
 
 **Author:** {STUDY_INFO['author']}  
 **Date:** {datetime.now().strftime('%Y-%m-%d')}  
@@ -564,39 +751,39 @@ def create_analysis_report(participant_data, case_data=None, output_dir='.'):
 ## Sample Characteristics
 
 - **Total Participants:** {len(participant_data)}
-- **AI Group:** {len(participant_data[participant_data['group'] == 'AI'])}
-- **Control Group:** {len(participant_data[participant_data['group'] == 'Control'])}
+- **AI Group:** {len(precomputed['ai_idx'])}
+- **Control Group:** {len(precomputed['control_idx'])}
 - **Completion Rate:** 100%
 
 ## Key Findings
 
-"""
+""")
 
         # Add statistical results
-        se_results = run_statistical_tests(
-            participant_data, measure_col='self_efficacy_change')
+        se_results = precomputed['se_results']
+        se_label = precomputed['se_label']
+        stress_label = precomputed['stress_label']
 
-        report_content += f"""### Primary Outcome: Self-Efficacy Change
+        report_buf.write(f"""### Primary Outcome: Self-Efficacy Change
 
-- **Effect Size:** d = {se_results['effect_size']:.3f} ({interpret_effect_size(se_results['effect_size'])})
+- **Effect Size:** d = {se_results['effect_size']:.3f} ({se_label})
 - **Statistical Significance:** p = {se_results['t_test']['p_value']:.3f}
 - **Result:** {'Significant' if se_results['t_test']['significant'] else 'Not Significant'}
 
-"""
+""")
 
         # Add stress results if available
-        if 'post_stress' in participant_data.columns:
-            stress_results = run_statistical_tests(
-                participant_data, measure_col='post_stress')
-            report_content += f"""### Secondary Outcome: Post-Intervention Stress
+        stress_results = precomputed['stress_results']
+        if stress_results is not None:
+            report_buf.write(f"""### Secondary Outcome: Post-Intervention Stress
 
-- **Effect Size:** d = {stress_results['effect_size']:.3f} ({interpret_effect_size(stress_results['effect_size'])})
+- **Effect Size:** d = {stress_results['effect_size']:.3f} ({stress_label})
 - **Statistical Significance:** p = {stress_results['t_test']['p_value']:.3f}
 - **Result:** {'Significant' if stress_results['t_test']['significant'] else 'Not Significant'}
 
-"""
+""")
 
-        report_content += """## Recommendations
+        report_buf.write("""## Recommendations
 
 Based on the pilot study results:
 
@@ -611,14 +798,13 @@ Based on the pilot study results:
 - Demographics table (LaTeX)
 - Statistical results summary
 - Publication-ready figures
-"""
+""")
 
         # Save report
-        with open(report_path, 'w') as f:
-            f.write(report_content)
+        _write_files({report_path: report_buf.getvalue()})
 
         print(f"📊 Analysis report generated: {report_path}")
-        return report_path
+        return str(report_path)
 
     except Exception as e:
         print(f"❌ Error creating analysis report: {e}")
@@ -8,23 +8,20 @@ Primary orchestration script that brings together all analysis modules
 to run the complete analysis pipeline.
 """
 
+import gc
+import io
+import os
 import sys
 import warnings
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
-# Import our modules
+# Import our modules; SciPy-, matplotlib- and export-backed modules are
+# imported inside the pipeline stages so --help and early errors stay fast
 from config import OUTPUT_FILES, STUDY_INFO
 from data_processing import load_and_process_data, add_demographic_groups, get_data_summary
-from statistical_analysis import run_statistical_tests, analyze_subgroups, power_analysis
-from visualization import (
-    plot_group_comparison, plot_pre_post_comparison, plot_effect_size_forest,
-    plot_power_analysis, plot_demographics_distribution
-)
-from export_utils import (
-    export_publication_materials, create_analysis_report,
-    print_file_list, create_results_summary
-)
 
 warnings.filterwarnings('ignore')
 
@@ -38,6 +35,47 @@ def print_header():
     print("=" * 60)
 
 
+def _emit(buffer):
+    """Write a phase's buffered report to stdout in one call and reset it."""
+    sys.stdout.write(buffer.getvalue())
+    buffer.seek(0)
+    buffer.truncate()
+
+
+def _render_plot(plot_name, *args):
+    """Create, save and close one visualization figure; runs in a worker process."""
+    import visualization
+    return visualization.close_figure(getattr(visualization, plot_name)(*args))
+
+
+def render_plots(plot_jobs):
+    """
+    Render independent figures in parallel worker processes.
+
+    matplotlib is not thread-safe, so each figure is drawn and saved in its
+    own process; if a process pool cannot be started the jobs run serially.
+
+    Parameters:
+    -----------
+    plot_jobs : list of tuple
+        (visualization function name, positional arguments) per figure;
+        pass only the data columns the plot needs to keep pickling cheap
+
+    Returns:
+    --------
+    list : Saved figure paths (base filenames), in job order
+    """
+    # Flush so worker processes never inherit buffered output
+    sys.stdout.flush()
+    try:
+        with ProcessPoolExecutor(max_workers=min(len(plot_jobs), 4)) as executor:
+            futures = [executor.submit(_render_plot, name, *args)
+                       for name, args in plot_jobs]
+            return [future.result() for future in futures]
+    except (OSError, BrokenProcessPool):
+        return [_render_plot(name, *args) for name, args in plot_jobs]
+
+
 def run_primary_analysis(participant_data, output_dir='.'):
     """
     Run the primary analysis pipeline.
@@ -53,15 +91,21 @@ def run_primary_analysis(participant_data, output_dir='.'):
     --------
     dict : Analysis results
     """
-    print("\n" + "="*60)
-    print("🔬 PRIMARY ANALYSIS PIPELINE")
-    print("="*60)
+    from statistical_analysis import run_statistical_tests
+
+    # Each phase writes its report into one buffer that is emitted in a
+    # single write, instead of one locked, flushed print per line
+    out = io.StringIO()
+
+    print("\n" + "="*60, file=out)
+    print("🔬 PRIMARY ANALYSIS PIPELINE", file=out)
+    print("="*60, file=out)
 
     results = {}
 
     # 1. Descriptive Statistics
-    print("\n📊 1. DESCRIPTIVE STATISTICS")
-    print("-" * 40)
+    print("\n📊 1. DESCRIPTIVE STATISTICS", file=out)
+    print("-" * 40, file=out)
 
     from export_utils import create_descriptive_table
     desc_table = create_descriptive_table(
@@ -69,24 +113,25 @@ def run_primary_analysis(participant_data, output_dir='.'):
         measures=['self_efficacy_change', 'post_stress'] if 'post_stress' in participant_data.columns
         else ['self_efficacy_change']
     )
-    print(desc_table.to_string(index=False))
+    print(desc_table.to_string(index=False), file=out)
     results['descriptives'] = desc_table
+    _emit(out)
 
     # 2. Statistical Tests
-    print("\n🧮 2. STATISTICAL TESTS")
-    print("-" * 40)
+    print("\n🧮 2. STATISTICAL TESTS", file=out)
+    print("-" * 40, file=out)
 
     # Self-efficacy change
     se_results = run_statistical_tests(
         participant_data, measure_col='self_efficacy_change')
 
-    print(f"Self-Efficacy Change:")
+    print(f"Self-Efficacy Change:", file=out)
     print(f"  Effect Size (Cohen's d): {se_results['effect_size']:.3f} " +
-          f"({se_results.get('interpretation', 'Unknown')})")
+          f"({se_results.get('interpretation', 'Unknown')})", file=out)
     print(f"  t-test: t = {se_results['t_test']['statistic']:.3f}, " +
-          f"p = {se_results['t_test']['p_value']:.3f}")
+          f"p = {se_results['t_test']['p_value']:.3f}", file=out)
     print(f"  Mann-Whitney U: U = {se_results['mann_whitney']['statistic']:.1f}, " +
-          f"p = {se_results['mann_whitney']['p_value']:.3f}")
+          f"p = {se_results['mann_whitney']['p_value']:.3f}", file=out)
 
     results['self_efficacy_results'] = se_results
 
@@ -96,64 +141,65 @@ def run_primary_analysis(participant_data, output_dir='.'):
         stress_results = run_statistical_tests(
             participant_data, measure_col='post_stress')
 
-        print(f"\nPost-Intervention Stress:")
+        print(f"\nPost-Intervention Stress:", file=out)
         print(
-            f"  Effect Size (Cohen's d): {stress_results['effect_size']:.3f}")
+            f"  Effect Size (Cohen's d): {stress_results['effect_size']:.3f}", file=out)
         print(f"  t-test: t = {stress_results['t_test']['statistic']:.3f}, " +
-              f"p = {stress_results['t_test']['p_value']:.3f}")
+              f"p = {stress_results['t_test']['p_value']:.3f}", file=out)
 
         results['stress_results'] = stress_results
+    _emit(out)
 
     # 3. Create Visualizations
-    print("\n📈 3. CREATING VISUALIZATIONS")
-    print("-" * 40)
+    print("\n📈 3. CREATING VISUALIZATIONS", file=out)
+    print("-" * 40, file=out)
+    _emit(out)
 
-    figures = []
+    # Figures are independent, so they are drawn and saved in parallel;
+    # each job gets only the columns its plot reads
+    plot_jobs = []
 
     # Primary outcome plot
-    fig1 = plot_group_comparison(
-        participant_data, 'self_efficacy_change',
+    plot_jobs.append(('plot_group_comparison', (
+        participant_data[['group', 'self_efficacy_change']], 'self_efficacy_change',
         'Primary Outcome: Self-Efficacy Change',
         f"{output_dir}/{OUTPUT_FILES['self_efficacy_plot']}"
-    )
-    figures.append(fig1)
+    )))
 
     # Secondary outcome plot (if available)
     if 'post_stress' in participant_data.columns:
-        fig2 = plot_group_comparison(
-            participant_data, 'post_stress',
+        plot_jobs.append(('plot_group_comparison', (
+            participant_data[['group', 'post_stress']], 'post_stress',
             'Secondary Outcome: Post-Intervention Stress',
             f"{output_dir}/{OUTPUT_FILES['stress_plot']}"
-        )
-        figures.append(fig2)
+        )))
 
     # Pre-post comparison
     if 'pre_self_efficacy' in participant_data.columns and 'post_self_efficacy' in participant_data.columns:
-        fig3 = plot_pre_post_comparison(
-            participant_data,
+        plot_jobs.append(('plot_pre_post_comparison', (
+            participant_data[['participant_id', 'group',
+                              'pre_self_efficacy', 'post_self_efficacy']],
             f"{output_dir}/{OUTPUT_FILES['pre_post_plot']}"
-        )
-        figures.append(fig3)
+        )))
 
     # Effect size forest plot
     effect_sizes = {'self_efficacy_change': se_results['effect_size']}
     if stress_results:
         effect_sizes['post_stress'] = stress_results['effect_size']
 
-    fig4 = plot_effect_size_forest(
-        effect_sizes, participant_data,
+    plot_jobs.append(('plot_effect_size_forest', (
+        effect_sizes, participant_data[['group']],
         f"{output_dir}/{OUTPUT_FILES['effect_sizes_plot']}"
-    )
-    figures.append(fig4)
+    )))
 
-    results['figures'] = figures
+    results['figures'] = render_plots(plot_jobs)
 
     print("✅ Primary analysis complete!")
 
     return results
 
 
-def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
+def run_secondary_analyses(participant_data, case_data=None, output_dir='.', primary_results=None):
     """
     Run secondary and exploratory analyses.
 
@@ -165,11 +211,17 @@ def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
         Case-level dataset (optional)
     output_dir : str
         Directory for output files
+    primary_results : dict
+        Primary analysis results; the self-efficacy tests are reused for
+        the pilot effect size
 
     Returns:
     --------
     dict : Secondary analysis results
     """
+    from statistical_analysis import run_statistical_tests, analyze_subgroups, power_analysis
+    from visualization import plot_power_analysis, plot_demographics_distribution, close_figure
+
     print("\n" + "="*60)
     print("🔍 SECONDARY ANALYSES")
     print("="*60)
@@ -202,9 +254,11 @@ def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
     print("\n⚡ 2. POWER ANALYSIS")
     print("-" * 40)
 
-    # Get pilot effect size
-    se_results = run_statistical_tests(
-        participant_data, measure_col='self_efficacy_change')
+    # Get pilot effect size (reuse the primary self-efficacy tests if available)
+    se_results = (primary_results or {}).get('self_efficacy_results')
+    if se_results is None:
+        se_results = run_statistical_tests(
+            participant_data, measure_col='self_efficacy_change')
     pilot_effect_size = abs(se_results['effect_size'])
 
     # Power for target sample size (N=600)
@@ -212,10 +266,10 @@ def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
     print(f"Power for N=600 (300 per group): {power_600:.3f}")
 
     # Create power analysis plot
-    fig_power = plot_power_analysis(
+    fig_power = close_figure(plot_power_analysis(
         [pilot_effect_size], max_n=1000, target_n=600,
         save_name=f"{output_dir}/{OUTPUT_FILES['power_analysis_plot']}"
-    )
+    ))
 
     results['power_analysis'] = {'power_600': power_600, 'figure': fig_power}
 
@@ -251,7 +305,7 @@ def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
                 "\n  ✅ No significant baseline differences - randomization appears successful.")
 
         # Create baseline comparison visualization
-        fig_baseline = plot_baseline_comparison(participant_data, output_dir)
+        fig_baseline = close_figure(plot_baseline_comparison(participant_data, output_dir))
 
         results['baseline_analysis'] = {
             'baseline_stats': baseline_stats,
@@ -314,10 +368,10 @@ def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
         try:
             from visualization import plot_baseline_adjusted_comparison, plot_baseline_adjusted_summary_table
 
-            fig_adjusted_comparison = plot_baseline_adjusted_comparison(
-                adjusted_results, output_dir)
-            fig_adjusted_table = plot_baseline_adjusted_summary_table(
-                adjusted_results, output_dir)
+            fig_adjusted_comparison = close_figure(plot_baseline_adjusted_comparison(
+                adjusted_results, output_dir))
+            fig_adjusted_table = close_figure(plot_baseline_adjusted_summary_table(
+                adjusted_results, output_dir))
 
             results['baseline_adjusted_analysis'] = {
                 'adjusted_results': adjusted_results,
@@ -362,12 +416,12 @@ def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
                 print(f"  {dim_label.title()}: {dim_results['error']}")
 
         # Create dimensional visualizations
-        fig_trajectory = plot_self_efficacy_dimensions_trajectory(
-            participant_data, output_dir)
-        fig_change = plot_self_efficacy_dimensions_change(
-            participant_data, output_dir)
-        fig_effects = plot_self_efficacy_dimensions_effect_sizes(
-            dimension_results, output_dir)
+        fig_trajectory = close_figure(plot_self_efficacy_dimensions_trajectory(
+            participant_data, output_dir, dimension_results))
+        fig_change = close_figure(plot_self_efficacy_dimensions_change(
+            participant_data, output_dir))
+        fig_effects = close_figure(plot_self_efficacy_dimensions_effect_sizes(
+            dimension_results, output_dir))
 
         results['dimensional_analysis'] = {
             'results': dimension_results,
@@ -384,17 +438,22 @@ def run_secondary_analyses(participant_data, case_data=None, output_dir='.'):
 
     # Age distribution
     if 'age' in participant_data.columns:
-        fig_age = plot_demographics_distribution(
+        fig_age = close_figure(plot_demographics_distribution(
             participant_data, 'age', f"{output_dir}/demographics_age"
-        )
+        ))
         results['demographics_plots'] = [fig_age]
 
+    # Figures hold reference cycles; free the closed ones now rather than
+    # at some later collection
+    gc.collect()
+
     print("✅ Secondary analyses complete!")
 
     return results
 
 
-def run_export_pipeline(participant_data, case_data=None, output_dir='.', secondary_results=None):
+def run_export_pipeline(participant_data, case_data=None, output_dir='.', secondary_results=None,
+                        primary_results=None):
     """
     Run the export and reporting pipeline.
 
@@ -408,11 +467,19 @@ def run_export_pipeline(participant_data, case_data=None, output_dir='.', second
         Directory for output files
     secondary_results : dict
         Secondary analysis results including dimensional analysis
+    primary_results : dict
+        Primary analysis results; their descriptive table and outcome tests
+        are reused
 
     Returns:
     --------
     dict : Exported file paths
     """
+    from export_utils import (
+        export_publication_materials, create_analysis_report,
+        print_file_list, compute_report_results, select_report_columns
+    )
+
     print("\n" + "="*60)
     print("📄 EXPORT AND REPORTING")
     print("="*60)
@@ -424,14 +491,29 @@ def run_export_pipeline(participant_data, case_data=None, output_dir='.', second
         if 'results' in dim_analysis:
             dimension_results = dim_analysis['results']
 
+    # Key outcome tests shared by every exported text; the primary analysis
+    # already ran them on the same data, so its results are reused
+    primary_results = primary_results or {}
+    try:
+        precomputed = compute_report_results(
+            select_report_columns(participant_data),
+            se_results=primary_results.get('self_efficacy_results'),
+            stress_results=primary_results.get('stress_results')
+        )
+    except Exception as e:
+        print(f"Warning: Could not precompute report results: {e}")
+        precomputed = None
+
     # Export all publication materials
     exported_files = export_publication_materials(
-        participant_data, output_dir, dimension_results=dimension_results
+        participant_data, output_dir, dimension_results=dimension_results,
+        precomputed=precomputed,
+        desc_table=primary_results.get('descriptives')
     )
 
     # Create comprehensive analysis report
     report_path = create_analysis_report(
-        participant_data, case_data, output_dir)
+        participant_data, case_data, output_dir, precomputed=precomputed)
     if report_path:
         exported_files['report'] = report_path
 
@@ -465,6 +547,10 @@ def main():
 
     args = parser.parse_args()
 
+    # Figures are only written to files, so use the non-interactive Agg
+    # backend unless the user picked one; plot worker processes inherit it
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+
     # Create output directory if it doesn't exist
     output_dir = Path(args.output)
     output_dir.mkdir(exist_ok=True)
@@ -493,14 +579,15 @@ def main():
         secondary_results = {}
         if not args.skip_secondary:
             secondary_results = run_secondary_analyses(
-                participant_data, case_data, str(output_dir)
+                participant_data, case_data, str(output_dir), primary_results
             )
 
         # Run export pipeline (unless skipped)
         exported_files = {}
         if not args.skip_export:
             exported_files = run_export_pipeline(
-                participant_data, case_data, str(output_dir), secondary_results
+                participant_data, case_data, str(output_dir), secondary_results,
+                primary_results
             )
 
         # Final summary
@@ -554,6 +641,17 @@ if __name__ == "__main__":
         print("Loading data and making functions available...")
 
         try:
+            # The pipeline imports these lazily; interactive use wants them at hand
+            from statistical_analysis import run_statistical_tests, analyze_subgroups, power_analysis
+            from visualization import (
+                plot_group_comparison, plot_pre_post_comparison, plot_effect_size_forest,
+                plot_power_analysis, plot_demographics_distribution, quick_plot
+            )
+            from export_utils import (
+                export_publication_materials, create_analysis_report, print_file_list,
+                create_results_summary, compute_report_results, select_report_columns
+            )
+
             raw_data, participant_data, case_data = load_and_process_data()
             print("✅ Data loaded successfully!")
             print("\nAvailable for interactive use:")
@@ -7,14 +7,40 @@ Statistical Analysis Module for AI-Assisted Empathetic Communication Analysis
 Contains all statistical testing functions, effect size calculations, and analysis utilities.
 """
 
+import copy
+import functools
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 import scipy.stats as stats
 from scipy.stats import ttest_ind, ttest_rel, mannwhitneyu, wilcoxon, shapiro, levene
 from config import ALPHA, EFFECT_SIZE_THRESHOLDS, EFFECT_SIZE_LABELS
 
+# Effect size bins: |d| below the i-th threshold gets the i-th label
+_EFFECT_SIZE_BINS = np.array([EFFECT_SIZE_THRESHOLDS[k] for k in ('negligible', 'small', 'medium')])
+_EFFECT_SIZE_BIN_LABELS = np.array(
+    [EFFECT_SIZE_LABELS[k] for k in ('negligible', 'small', 'medium', 'large')], dtype=object)
+
+# Below this many subgroup levels a thread pool costs more than it saves
+_PARALLEL_SUBGROUP_LEVELS = 4
+
+# run_statistical_tests results, keyed on a digest of the two columns used
+_TESTS_CACHE = OrderedDict()
+_TESTS_CACHE_LOCK = threading.Lock()
+_TESTS_CACHE_SIZE = 128
+_TESTS_CACHE_MAX_ROWS = 1_000_000
+
+# Two-sided critical z for the configured significance level
+_Z_ALPHA = stats.norm.ppf(1 - ALPHA/2)
 
-def calculate_descriptive_stats(data, group_col='group', measure_col='self_efficacy_change'):
+
+def calculate_descriptive_stats(data, group_col='group', measure_col='self_efficacy_change',
+                                groups_dict=None):
     """
     Calculate descriptive statistics by group.
 
@@ -26,27 +52,138 @@ def calculate_descriptive_stats(data, group_col='group', measure_col='self_effic
         Column name for grouping variable
     measure_col : str
         Column name for outcome measure
+    groups_dict : dict
+        Optional group label -> NaN-free values array, as built by
+        split_groups; when given, data is not scanned again
 
     Returns:
     --------
     pandas.DataFrame : Descriptive statistics by group
     """
-    stats_dict = {}
-    for group in data[group_col].unique():
-        group_data = data[data[group_col] == group][measure_col].dropna()
-
-        stats_dict[group] = {
-            'n': len(group_data),
-            'mean': group_data.mean(),
-            'std': group_data.std(),
-            'median': group_data.median(),
-            'q25': group_data.quantile(0.25),
-            'q75': group_data.quantile(0.75),
-            'min': group_data.min(),
-            'max': group_data.max()
-        }
+    if groups_dict is not None:
+        # Concatenate the groups and describe them column-wise in one pass
+        sizes = [len(values) for values in groups_dict.values()]
+        codes = np.repeat(np.arange(len(sizes)), sizes)
+        values = np.concatenate([np.empty(0), *groups_dict.values()])
+        return _grouped_describe(values, codes, list(groups_dict))
+
+    # Groups stay in order of appearance, as with groupby(sort=False)
+    codes, groups = pd.factorize(data[group_col], sort=False)
+    values = data[measure_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return _grouped_describe(values, codes, groups)
+
+
+def _grouped_describe(values, codes, groups):
+    """
+    Descriptive statistics for every group from one sort of the values.
+
+    Values are ordered by (group code, value) with a single lexsort, so each
+    group is a contiguous sorted slice: min, max and the quartiles are read
+    off by position for all groups at once, and the moments come from
+    bincount sums.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        Float values per row (NaNs are ignored)
+    codes : numpy.ndarray
+        Group code per row (negative codes are ignored)
+    groups : array-like
+        Group label per code
 
-    return pd.DataFrame(stats_dict).T
+    Returns:
+    --------
+    pandas.DataFrame : Descriptive statistics by group
+    """
+    n_groups = len(groups)
+    valid = ~np.isnan(values) & (codes >= 0)
+    codes = codes[valid]
+    values = values[valid]
+
+    sorted_values = values[np.lexsort((values, codes))]
+    n = np.bincount(codes, minlength=n_groups)
+    start = np.cumsum(n) - n
+    last = np.maximum(n - 1, 0)
+    empty = n == 0
+    if empty.all():
+        sorted_values = np.full(1, np.nan)  # every lookup below lands on NaN
+
+    def quantile(q):
+        # Linear interpolation between order statistics, as np.quantile does
+        position = last * q
+        below = np.floor(position).astype(np.intp)
+        above = np.minimum(below + 1, last)
+        fraction = position - below
+        lower = sorted_values[np.minimum(start + below, len(sorted_values) - 1)]
+        upper = sorted_values[np.minimum(start + above, len(sorted_values) - 1)]
+        result = np.where(fraction >= 0.5,
+                          upper - (upper - lower) * (1 - fraction),
+                          lower + (upper - lower) * fraction)
+        return np.where(empty, np.nan, result)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.bincount(codes, weights=values, minlength=n_groups) / n
+        deviations = values - mean[codes]
+        variance = np.bincount(codes, weights=deviations * deviations, minlength=n_groups) / (n - 1)
+
+    return pd.DataFrame({
+        'n': n,
+        'mean': mean,
+        'std': np.where(n > 1, np.sqrt(variance), np.nan),
+        'median': quantile(0.5),
+        'q25': quantile(0.25),
+        'q75': quantile(0.75),
+        'min': quantile(0.0),
+        'max': quantile(1.0)
+    }, index=pd.Index(groups))
+
+
+def _split_by_codes(values, codes, n_groups):
+    """
+    Split values into one array per integer code, dropping NaNs once.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        Float values per row
+    codes : numpy.ndarray
+        Group code per row (negative codes are dropped)
+    n_groups : int
+        Number of codes; groups without valid values get empty arrays
+
+    Returns:
+    --------
+    list : numpy arrays of non-missing values, indexed by code
+    """
+    valid = ~np.isnan(values) & (codes >= 0)
+    codes = codes[valid]
+    values = values[valid]
+
+    order = np.argsort(codes, kind='stable')
+    counts = np.bincount(codes, minlength=n_groups)
+    return np.split(values[order], np.cumsum(counts)[:-1])
+
+
+def split_groups(data, group_col='group', measure_col='self_efficacy_change'):
+    """
+    Split a measure into one NaN-free array per group in a single pass.
+
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Dataset containing the variables
+    group_col : str
+        Column name for grouping variable
+    measure_col : str
+        Column name for outcome measure
+
+    Returns:
+    --------
+    dict : Group label -> numpy array of non-missing values (order of appearance)
+    """
+    codes, groups = pd.factorize(data[group_col], sort=False)
+    values = data[measure_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return dict(zip(groups, _split_by_codes(values, codes, len(groups))))
 
 
 def calculate_effect_size(group1, group2, method='cohen_d'):
@@ -56,9 +193,9 @@ def calculate_effect_size(group1, group2, method='cohen_d'):
     Parameters:
     -----------
     group1 : array-like
-        First group data
+        First group data (no missing values)
     group2 : array-like  
-        Second group data
+        Second group data (no missing values)
     method : str
         Effect size method ('cohen_d', 'glass_delta', 'hedges_g')
 
@@ -66,19 +203,65 @@ def calculate_effect_size(group1, group2, method='cohen_d'):
     --------
     float : Effect size value
     """
-    if method == 'cohen_d':
-        pooled_std = np.sqrt(((len(group1) - 1) * group1.var() +
-                             (len(group2) - 1) * group2.var()) /
-                             (len(group1) + len(group2) - 2))
-        return (group1.mean() - group2.mean()) / pooled_std
+    g1 = np.asarray(group1, dtype=np.float64)
+    g2 = np.asarray(group2, dtype=np.float64)
+    n1, n2 = g1.size, g2.size
+    m1, v1 = _mean_var(g1)
+    m2, v2 = _mean_var(g2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'cohen_d':
+            return _cohen_from_moments(m1, m2, v1, v2, n1, n2)
+
+        elif method == 'glass_delta':
+            return (m1 - m2) / np.sqrt(v2)
+
+        elif method == 'hedges_g':
+            correction = 1 - (3 / (4 * (n1 + n2) - 9))
+            return _cohen_from_moments(m1, m2, v1, v2, n1, n2) * correction
+
+
+def calculate_effect_size_from_stats(mean1, std1, n1, mean2, std2, n2):
+    """
+    Calculate Cohen's d from group summary statistics.
 
-    elif method == 'glass_delta':
-        return (group1.mean() - group2.mean()) / group2.std()
+    Equivalent to calculate_effect_size(group1, group2) when the moments
+    are already known; all arguments may also be arrays of equal length.
 
-    elif method == 'hedges_g':
-        cohen_d = calculate_effect_size(group1, group2, 'cohen_d')
-        correction = 1 - (3 / (4 * (len(group1) + len(group2)) - 9))
-        return cohen_d * correction
+    Parameters:
+    -----------
+    mean1, mean2 : float or array-like
+        Group means
+    std1, std2 : float or array-like
+        Group sample standard deviations (ddof=1)
+    n1, n2 : int or array-like
+        Group sizes
+
+    Returns:
+    --------
+    float or numpy.ndarray : Cohen's d
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _cohen_from_moments(np.asarray(mean1, dtype=np.float64),
+                                   np.asarray(mean2, dtype=np.float64),
+                                   np.square(std1, dtype=np.float64),
+                                   np.square(std2, dtype=np.float64),
+                                   np.asarray(n1), np.asarray(n2))
+
+
+def _mean_var(values):
+    """Mean and sample variance (ddof=1) of an array, NaN when undefined."""
+    n = values.size
+    mean = values.mean() if n else np.nan
+    var = values.var(ddof=1) if n > 1 else np.nan
+    return mean, var
+
+
+def _cohen_from_moments(m1, m2, v1, v2, n1, n2):
+    """Cohen's d from group means, sample variances and sizes."""
+    # np.divide keeps the NaN-on-zero-denominator behaviour of the pandas path
+    pooled_std = np.sqrt(np.divide((n1 - 1) * v1 + (n2 - 1) * v2, n1 + n2 - 2))
+    return (m1 - m2) / pooled_std
 
 
 def interpret_effect_size(d):
@@ -94,18 +277,29 @@ def interpret_effect_size(d):
     --------
     str : Effect size interpretation
     """
-    abs_d = abs(d)
-    if abs_d < EFFECT_SIZE_THRESHOLDS['negligible']:
-        return EFFECT_SIZE_LABELS['negligible']
-    elif abs_d < EFFECT_SIZE_THRESHOLDS['small']:
-        return EFFECT_SIZE_LABELS['small']
-    elif abs_d < EFFECT_SIZE_THRESHOLDS['medium']:
-        return EFFECT_SIZE_LABELS['medium']
-    else:
-        return EFFECT_SIZE_LABELS['large']
+    return _EFFECT_SIZE_BIN_LABELS[np.searchsorted(_EFFECT_SIZE_BINS, abs(d), side='right')]
+
+
+def interpret_effect_sizes(effect_sizes):
+    """
+    Interpret many Cohen's d values at once (see interpret_effect_size).
 
+    Parameters:
+    -----------
+    effect_sizes : array-like
+        Effect size values
 
-def test_normality(data, group_col='group', measure_col='self_efficacy_change'):
+    Returns:
+    --------
+    numpy.ndarray : Effect size interpretation per value (NaN counts as large,
+    as in interpret_effect_size)
+    """
+    abs_d = np.abs(np.asarray(effect_sizes, dtype=np.float64))
+    return _EFFECT_SIZE_BIN_LABELS[np.searchsorted(_EFFECT_SIZE_BINS, abs_d, side='right')]
+
+
+def test_normality(data, group_col='group', measure_col='self_efficacy_change',
+                   groups_dict=None):
     """
     Test normality assumption for each group.
 
@@ -117,15 +311,20 @@ def test_normality(data, group_col='group', measure_col='self_efficacy_change'):
         Column name for grouping variable
     measure_col : str
         Column name for outcome measure
+    groups_dict : dict
+        Optional group label -> NaN-free values array (see split_groups);
+        when given, the arrays go straight to shapiro and data is not used
 
     Returns:
     --------
     dict : Normality test results for each group
     """
+    if groups_dict is None:
+        groups_dict = split_groups(data, group_col, measure_col)
+
     normality_results = {}
 
-    for group in data[group_col].unique():
-        group_data = data[data[group_col] == group][measure_col].dropna()
+    for group, group_data in groups_dict.items():
         if len(group_data) >= 3:  # Minimum for Shapiro-Wilk test
             stat, p_value = shapiro(group_data)
             normality_results[group] = {
@@ -143,7 +342,8 @@ def test_normality(data, group_col='group', measure_col='self_efficacy_change'):
     return normality_results
 
 
-def test_homoscedasticity(data, group_col='group', measure_col='self_efficacy_change'):
+def test_homoscedasticity(data, group_col='group', measure_col='self_efficacy_change',
+                          groups_dict=None):
     """
     Test equal variances assumption using Levene's test.
 
@@ -155,15 +355,17 @@ def test_homoscedasticity(data, group_col='group', measure_col='self_efficacy_ch
         Column name for grouping variable
     measure_col : str
         Column name for outcome measure
+    groups_dict : dict
+        Optional group label -> NaN-free values array (see split_groups);
+        when given, the arrays go straight to levene and data is not used
 
     Returns:
     --------
     dict : Levene's test results
     """
-    groups = []
-    for group in data[group_col].unique():
-        group_data = data[data[group_col] == group][measure_col].dropna()
-        groups.append(group_data)
+    if groups_dict is None:
+        groups_dict = split_groups(data, group_col, measure_col)
+    groups = list(groups_dict.values())
 
     if len(groups) >= 2 and all(len(g) > 0 for g in groups):
         stat, p_value = levene(*groups)
@@ -197,19 +399,86 @@ def run_statistical_tests(data, group_col='group', measure_col='self_efficacy_ch
     --------
     dict : Comprehensive statistical test results
     """
-    # Separate groups - assuming binary comparison for now
-    groups = data[group_col].unique()
-    if len(groups) != 2:
+    if len(data) > _TESTS_CACHE_MAX_ROWS:
+        return _run_statistical_tests(data, group_col, measure_col)
+
+    # Identical group/measure contents give identical results, so repeated
+    # calls (same frame, or an equal slice of it) are served from the cache
+    key = (_columns_digest(data, group_col, measure_col), group_col, measure_col)
+    with _TESTS_CACHE_LOCK:
+        results = _TESTS_CACHE.get(key)
+        if results is not None:
+            _TESTS_CACHE.move_to_end(key)
+
+    if results is None:
+        results = _run_statistical_tests(data, group_col, measure_col)
+        with _TESTS_CACHE_LOCK:
+            _TESTS_CACHE[key] = results
+            if len(_TESTS_CACHE) > _TESTS_CACHE_SIZE:
+                _TESTS_CACHE.popitem(last=False)
+
+    # Callers annotate the returned dict, so never hand out the cached one
+    return copy.deepcopy(results)
+
+
+def _clear_statistical_tests_cache():
+    """Drop all cached run_statistical_tests results."""
+    with _TESTS_CACHE_LOCK:
+        _TESTS_CACHE.clear()
+
+
+run_statistical_tests.cache_clear = _clear_statistical_tests_cache
+
+
+def _columns_digest(data, group_col, measure_col):
+    """8-byte content digest of the group and measure columns (index ignored)."""
+    hashes = pd.util.hash_pandas_object(data[[group_col, measure_col]], index=False)
+    return hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=8).digest()
+
+
+def _run_statistical_tests(data, group_col, measure_col):
+    """Uncached body of run_statistical_tests."""
+    # Separate groups - assuming binary comparison for now. The split keeps
+    # order of appearance, so its keys are the observed groups; unique() is
+    # only needed to word the error (it also counts a missing group label)
+    groups_dict = split_groups(data, group_col, measure_col)
+    if len(groups_dict) != 2 or data[group_col].hasnans:
+        groups = data[group_col].unique()
         raise ValueError(f"Expected 2 groups, got {len(groups)}: {groups}")
 
-    group1_data = data[data[group_col] == groups[0]][measure_col].dropna()
-    group2_data = data[data[group_col] == groups[1]][measure_col].dropna()
+    group1, group2 = groups_dict
+    return compare_group_arrays(groups_dict, group1, group2)
+
+
+def compare_group_arrays(groups_dict, group1, group2, tests=None):
+    """
+    Run the run_statistical_tests battery on pre-split group arrays.
+
+    Parameters:
+    -----------
+    groups_dict : dict
+        Group label -> NaN-free values array for exactly the two groups,
+        in the order they should appear in the descriptives
+    group1 : hashable
+        Label of the first group (positive effect sizes favour this group)
+    group2 : hashable
+        Label of the second group
+    tests : dict
+        Optional precomputed 't_test', 'welch_t' and 'mann_whitney' results for this
+        pair (see _stacked_group_tests)
+
+    Returns:
+    --------
+    dict : Comprehensive statistical test results
+    """
+    group1_data = groups_dict[group1]
+    group2_data = groups_dict[group2]
 
     results = {}
 
     # Descriptive statistics
     results['descriptives'] = calculate_descriptive_stats(
-        data, group_col, measure_col)
+        None, groups_dict=groups_dict)
 
     # Effect sizes
     results['effect_size'] = calculate_effect_size(
@@ -220,27 +489,40 @@ def run_statistical_tests(data, group_col='group', measure_col='self_efficacy_ch
         group1_data, group2_data, 'glass_delta')
 
     # Statistical tests
-    # Independent t-test
-    t_stat, t_p = ttest_ind(group1_data, group2_data)
-    results['t_test'] = {
-        'statistic': t_stat,
-        'p_value': t_p,
-        'significant': t_p < ALPHA
-    }
+    if tests is not None:
+        results['t_test'] = tests['t_test']
+        results['welch_t'] = tests['welch_t']
+        results['mann_whitney'] = tests['mann_whitney']
+    else:
+        # Independent t-test
+        t_stat, t_p = ttest_ind(group1_data, group2_data)
+        results['t_test'] = {
+            'statistic': t_stat,
+            'p_value': t_p,
+            'significant': t_p < ALPHA
+        }
 
-    # Mann-Whitney U test (non-parametric alternative)
-    u_stat, u_p = mannwhitneyu(
-        group1_data, group2_data, alternative='two-sided')
-    results['mann_whitney'] = {
-        'statistic': u_stat,
-        'p_value': u_p,
-        'significant': u_p < ALPHA
-    }
+        # Welch's t-test (does not assume equal variances)
+        w_stat, w_p = ttest_ind(group1_data, group2_data, equal_var=False)
+        results['welch_t'] = {
+            'statistic': w_stat,
+            'p_value': w_p,
+            'significant': w_p < ALPHA
+        }
+
+        # Mann-Whitney U test (non-parametric alternative)
+        u_stat, u_p = mannwhitneyu(
+            group1_data, group2_data, alternative='two-sided')
+        results['mann_whitney'] = {
+            'statistic': u_stat,
+            'p_value': u_p,
+            'significant': u_p < ALPHA
+        }
 
     # Assumption testing
-    results['normality'] = test_normality(data, group_col, measure_col)
+    results['normality'] = test_normality(None, groups_dict=groups_dict)
     results['homoscedasticity'] = test_homoscedasticity(
-        data, group_col, measure_col)
+        None, groups_dict=groups_dict)
 
     # Recommended test based on assumptions
     normality_ok = all(
@@ -254,6 +536,10 @@ def run_statistical_tests(data, group_col='group', measure_col='self_efficacy_ch
     if normality_ok and equal_var_ok:
         results['recommended_test'] = 't_test'
         results['recommended_p'] = results['t_test']['p_value']
+    elif normality_ok and equal_var_ok is False:
+        # Normal but Levene rejected equal variances
+        results['recommended_test'] = 'welch_t'
+        results['recommended_p'] = results['welch_t']['p_value']
     else:
         results['recommended_test'] = 'mann_whitney'
         results['recommended_p'] = results['mann_whitney']['p_value']
@@ -283,20 +569,25 @@ def paired_samples_test(data, pre_col, post_col, participant_col='participant_id
     # Remove rows with missing data in either pre or post
     complete_data = data[[participant_col, pre_col, post_col]].dropna()
 
-    pre_scores = complete_data[pre_col]
-    post_scores = complete_data[post_col]
+    pre_scores = complete_data[pre_col].to_numpy(dtype=np.float64)
+    post_scores = complete_data[post_col].to_numpy(dtype=np.float64)
     differences = post_scores - pre_scores
 
+    # Moments straight from the arrays, one mean/variance pass each
+    pre_mean, pre_var = _mean_var(pre_scores)
+    post_mean, post_var = _mean_var(post_scores)
+    diff_mean, diff_var = _mean_var(differences)
+
     results = {}
 
     # Descriptive statistics
     results['n_pairs'] = len(complete_data)
-    results['pre_mean'] = pre_scores.mean()
-    results['pre_std'] = pre_scores.std()
-    results['post_mean'] = post_scores.mean()
-    results['post_std'] = post_scores.std()
-    results['difference_mean'] = differences.mean()
-    results['difference_std'] = differences.std()
+    results['pre_mean'] = pre_mean
+    results['pre_std'] = np.sqrt(pre_var)
+    results['post_mean'] = post_mean
+    results['post_std'] = np.sqrt(post_var)
+    results['difference_mean'] = diff_mean
+    results['difference_std'] = np.sqrt(diff_var)
 
     # Paired t-test
     t_stat, p_value = ttest_rel(pre_scores, post_scores)
@@ -315,11 +606,91 @@ def paired_samples_test(data, pre_col, post_col, participant_col='participant_id
     }
 
     # Effect size for paired samples (Cohen's d_z)
-    results['effect_size_dz'] = differences.mean() / differences.std()
+    results['effect_size_dz'] = diff_mean / results['difference_std']
 
     return results
 
 
+def _stacked_group_tests(pairs):
+    """
+    t-test and Mann-Whitney U for many group pairs in one SciPy call each.
+
+    Parameters:
+    -----------
+    pairs : list of tuple
+        (group1_values, group2_values) NaN-free arrays per comparison
+
+    Returns:
+    --------
+    list of dict : 't_test', 'welch_t' and 'mann_whitney' results per pair
+    """
+    def pad(arrays):
+        # Ragged arrays become NaN-padded rows; nan_policy='omit' drops the padding
+        stacked = np.full((len(arrays), max(max(map(len, arrays)), 1)), np.nan)
+        for row, values in zip(stacked, arrays):
+            row[:len(values)] = values
+        return stacked
+
+    x = pad([pair[0] for pair in pairs])
+    y = pad([pair[1] for pair in pairs])
+
+    t_stat, t_p = ttest_ind(x, y, axis=1, nan_policy='omit')
+    w_stat, w_p = ttest_ind(x, y, axis=1, nan_policy='omit', equal_var=False)
+    u_stat, u_p = mannwhitneyu(x, y, axis=1, nan_policy='omit', alternative='two-sided')
+
+    return [
+        {
+            't_test': {'statistic': t_stat[i], 'p_value': t_p[i], 'significant': t_p[i] < ALPHA},
+            'welch_t': {'statistic': w_stat[i], 'p_value': w_p[i], 'significant': w_p[i] < ALPHA},
+            'mann_whitney': {'statistic': u_stat[i], 'p_value': u_p[i], 'significant': u_p[i] < ALPHA}
+        }
+        for i in range(len(pairs))
+    ]
+
+
+def run_statistical_tests_columns(data, measure_cols, group_col='group'):
+    """
+    Run the run_statistical_tests battery for several measures at once.
+
+    The group column is factorized once and the t-tests / Mann-Whitney U
+    for all measures go through one stacked SciPy call each.
+
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Dataset containing the variables
+    measure_cols : list of str
+        Column names of the outcome measures
+    group_col : str
+        Column name for grouping variable
+
+    Returns:
+    --------
+    dict : Measure column -> results, for the measures with data in both
+        groups; call run_statistical_tests on the others for their error
+    """
+    codes, groups = pd.factorize(data[group_col], sort=False)
+    if len(groups) != 2 or data[group_col].hasnans:
+        return {}
+
+    split = {}
+    for measure_col in measure_cols:
+        values = data[measure_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        group_arrays = _split_by_codes(values, codes, len(groups))
+        if all(len(values) for values in group_arrays):
+            split[measure_col] = dict(zip(groups, group_arrays))
+
+    if not split:
+        return {}
+
+    group1, group2 = groups
+    stacked = _stacked_group_tests([tuple(groups_dict.values()) for groups_dict in split.values()])
+    return {
+        measure_col: compare_group_arrays(groups_dict, group1, group2, tests=tests)
+        for (measure_col, groups_dict), tests in zip(split.items(), stacked)
+    }
+
+
 def analyze_subgroups(data, subgroup_col, outcome_col='self_efficacy_change',
                       group_col='group', min_size=None):
     """
@@ -346,26 +717,77 @@ def analyze_subgroups(data, subgroup_col, outcome_col='self_efficacy_change',
     if min_size is None:
         min_size = MIN_SUBGROUP_SIZE
 
-    subgroup_results = {}
-
-    for subgroup in data[subgroup_col].unique():
-        if pd.isna(subgroup):
+    # Partition once into (subgroup, group) cells, numbered in order of
+    # appearance so each subgroup's groups match its own unique() order;
+    # missing outcomes are filtered once for all cells
+    subgroup_codes, subgroup_labels = pd.factorize(data[subgroup_col], sort=False)
+    group_codes, group_labels = pd.factorize(data[group_col], sort=False,
+                                             use_na_sentinel=False)
+    n_groups = len(group_labels)
+    cell_codes, cell_keys = pd.factorize(subgroup_codes * n_groups + group_codes,
+                                         sort=False)
+    outcome = data[outcome_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    cell_values = _split_by_codes(outcome, cell_codes, len(cell_keys))
+    cell_sizes = np.bincount(cell_codes, minlength=len(cell_keys))
+
+    cells = {}
+    sizes = {}
+    for key, values, size in zip(cell_keys, cell_values, cell_sizes):
+        subgroup_code, group_code = divmod(int(key), n_groups)
+        if subgroup_code < 0:  # missing subgroup label
             continue
+        subgroup = subgroup_labels[subgroup_code]
+        cells.setdefault(subgroup, {})[group_labels[group_code]] = values
+        sizes[subgroup] = sizes.get(subgroup, 0) + int(size)
+
+    # Two-group comparisons share one stacked t-test / Mann-Whitney call
+    comparable = [subgroup for subgroup, groups_dict in cells.items()
+                  if sizes[subgroup] >= min_size and len(groups_dict) == 2]
+    stacked_tests = {}
+    if comparable:
+        pairs = [tuple(cells[subgroup].values()) for subgroup in comparable]
+        stacked_tests = dict(zip(comparable, _stacked_group_tests(pairs)))
+
+    def analyze_one(subgroup):
+        groups_dict = cells[subgroup]
+        n = sizes[subgroup]
+
+        if n < min_size:
+            return {'error': f'Insufficient sample size (n={n}, min={min_size})'}
+
+        if len(groups_dict) == 2:
+            group1, group2 = groups_dict
+            return compare_group_arrays(groups_dict, group1, group2,
+                                        tests=stacked_tests[subgroup])
+
+        # Let run_statistical_tests report the group mismatch
+        try:
+            return run_statistical_tests(
+                data[data[subgroup_col] == subgroup], group_col, outcome_col)
+        except ValueError as e:
+            return {'error': str(e)}
+
+    # Levels are independent; SciPy's tests release the GIL, so threads
+    # pay off once there are enough of them
+    if len(cells) >= _PARALLEL_SUBGROUP_LEVELS:
+        with ThreadPoolExecutor() as executor:
+            results = list(executor.map(analyze_one, cells))
+    else:
+        results = [analyze_one(subgroup) for subgroup in cells]
 
-        subset = data[data[subgroup_col] == subgroup]
+    return dict(zip(cells, results))
 
-        if len(subset) >= min_size:
-            try:
-                results = run_statistical_tests(subset, group_col, outcome_col)
-                subgroup_results[subgroup] = results
-            except ValueError as e:
-                subgroup_results[subgroup] = {'error': str(e)}
-        else:
-            subgroup_results[subgroup] = {
-                'error': f'Insufficient sample size (n={len(subset)}, min={min_size})'
-            }
 
-    return subgroup_results
+@functools.lru_cache(maxsize=256)
+def _t_critical(df, confidence_level):
+    """
+    Two-sided critical value of the t-distribution.
+
+    Only a handful of (df, confidence_level) pairs occur in one analysis,
+    so the ppf evaluation is cached.
+    """
+    alpha = 1 - confidence_level
+    return stats.t.ppf(1 - alpha/2, df)
 
 
 def calculate_confidence_interval(data, confidence_level=0.95):
@@ -383,21 +805,21 @@ def calculate_confidence_interval(data, confidence_level=0.95):
     --------
     tuple : (lower_bound, upper_bound)
     """
-    data = np.array(data)
-    data = data[~np.isnan(data)]  # Remove NaN values
+    data = np.asarray(data, dtype=np.float64)
+    valid = ~np.isnan(data)  # Skip NaN values without copying the rest
+    n = np.count_nonzero(valid)
 
-    if len(data) == 0:
+    if n == 0:
         return (np.nan, np.nan)
 
-    mean = np.mean(data)
-    sem = stats.sem(data)  # Standard error of the mean
-
-    # Calculate critical value for t-distribution
-    df = len(data) - 1
-    alpha = 1 - confidence_level
-    t_critical = stats.t.ppf(1 - alpha/2, df)
+    mean = np.add.reduce(data, where=valid) / n
+    if n > 1:
+        # Standard error of the mean (ddof=1)
+        sem = np.sqrt(np.add.reduce((data - mean) ** 2, where=valid) / (n - 1) / n)
+    else:
+        sem = np.nan
 
-    margin_of_error = t_critical * sem
+    margin_of_error = _t_critical(n - 1, confidence_level) * sem
 
     return (mean - margin_of_error, mean + margin_of_error)
 
@@ -433,19 +855,201 @@ def power_analysis(effect_size, sample_size_per_group, alpha=None):
 
         # Approximate power calculation
         # This is a simplified version - for production use, consider statsmodels.stats.power
-        z_alpha = stats.norm.ppf(1 - alpha/2)
-        z_beta = stats.norm.ppf(1 - 0.2)  # Assuming 80% power target
+        z_alpha = _Z_ALPHA if alpha == ALPHA else stats.norm.ppf(1 - alpha/2)
 
         n = sample_size_per_group
         delta = effect_size
 
-        # Approximate power
-        z_score = delta * np.sqrt(n/2) - z_alpha
-        power = stats.norm.cdf(z_score)
+        # Approximate power (standard normal CDF via erfc, no scipy dispatch)
+        z_score = delta * math.sqrt(n/2) - z_alpha
+        power = 0.5 * math.erfc(-z_score / math.sqrt(2))
 
         return max(0, min(1, power))  # Bound between 0 and 1
 
 
+def power_analysis_curve(effect_size, sample_sizes_per_group, alpha=None):
+    """
+    Calculate two-sample t-test power over many sample sizes at once.
+
+    Uses the exact noncentral-t distribution, evaluated in one vectorized
+    call rather than one power_analysis call per sample size.
+
+    Parameters:
+    -----------
+    effect_size : float
+        Expected effect size (Cohen's d)
+    sample_sizes_per_group : array-like
+        Sample sizes per group
+    alpha : float
+        Significance level (defaults to config ALPHA)
+
+    Returns:
+    --------
+    numpy.ndarray : Statistical power for each sample size
+    """
+    if alpha is None:
+        alpha = ALPHA
+
+    n = np.asarray(sample_sizes_per_group, dtype=float)
+    df = 2 * n - 2
+    nc = effect_size * np.sqrt(n / 2)
+    t_crit = stats.t.ppf(1 - alpha/2, df)
+
+    power = stats.nct.sf(t_crit, df, nc) + stats.nct.cdf(-t_crit, df, nc)
+
+    return np.clip(power, 0, 1)
+
+
+def _group_masks(labels, groups=('AI', 'Control')):
+    """
+    Boolean row masks for each group label from one integer-code pass.
+
+    Labels are factorized once into small integer codes, so each mask is a
+    cheap integer comparison instead of an object-by-object string compare.
+
+    Parameters:
+    -----------
+    labels : array-like
+        Group label per row
+    groups : tuple
+        Group labels to build masks for
+
+    Returns:
+    --------
+    list : One numpy boolean array per group, in the order of groups
+    """
+    codes = pd.Categorical(labels, categories=list(groups)).codes
+    return [codes == i for i in range(len(groups))]
+
+
+def _ancova_columns(groups, baseline, outcome):
+    """
+    Closed-form ANCOVA (outcome ~ group + baseline) for many column pairs at once.
+
+    Each column pair uses its own complete cases. The model has two groups
+    ('AI' as reference, 'Control') and a common baseline slope, so every
+    quantity follows from per-group sums of squares and cross-products;
+    these are computed for all columns with one set of array reductions.
+
+    Parameters:
+    -----------
+    groups : array-like
+        Group label per row
+    baseline : numpy.ndarray
+        Baseline scores, shape (n_rows, n_pairs)
+    outcome : numpy.ndarray
+        Outcome scores, shape (n_rows, n_pairs)
+
+    Returns:
+    --------
+    dict : Name -> numpy array with one value per column pair
+    """
+    ai_rows, control_rows = _group_masks(groups)
+    valid = ~np.isnan(baseline) & ~np.isnan(outcome)
+
+    def moments(mask):
+        # Count, means and centered sums of squares / cross-products
+        n = mask.sum(axis=0)
+        x_mean = np.where(mask, baseline, 0).sum(axis=0) / n
+        y_mean = np.where(mask, outcome, 0).sum(axis=0) / n
+        dx = np.where(mask, baseline - x_mean, 0)
+        dy = np.where(mask, outcome - y_mean, 0)
+        return n, x_mean, y_mean, (dx * dx).sum(axis=0), (dx * dy).sum(axis=0), (dy * dy).sum(axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n_ai, x_ai, y_ai, sxx_ai, sxy_ai, syy_ai = moments(valid & ai_rows[:, None])
+        n_ctl, x_ctl, y_ctl, sxx_ctl, sxy_ctl, syy_ctl = moments(valid & control_rows[:, None])
+        n, x_all, _, sxx_all, sxy_all, syy_all = moments(
+            valid & (ai_rows | control_rows)[:, None])
+
+        # Common within-group slope and residuals of the full model
+        slope = (sxy_ai + sxy_ctl) / (sxx_ai + sxx_ctl)
+        rss = (syy_ai + syy_ctl) - slope * (sxy_ai + sxy_ctl)
+        mse = rss / (n - 3)
+
+        # Type II F for group: drop in RSS when group is added to outcome ~ baseline
+        rss_reduced = syy_all - sxy_all ** 2 / sxx_all
+        f_stat = (rss_reduced - rss) / mse
+        p_value = stats.f.sf(f_stat, 1, n - 3)
+
+        # Least-squares means at the overall baseline mean
+        ai_adjusted = y_ai + slope * (x_all - x_ai)
+        control_adjusted = y_ctl + slope * (x_all - x_ctl)
+        residual_sd = np.sqrt(mse)
+
+        # Unadjusted Cohen's d on the outcome
+        raw_effect = (y_ai - y_ctl) / np.sqrt((syy_ai + syy_ctl) / (n_ai + n_ctl - 2))
+
+    return {
+        'n_total': n, 'n_ai': n_ai, 'n_control': n_ctl,
+        'f_stat': f_stat, 'p_value': p_value,
+        'ai_adjusted_mean': ai_adjusted, 'control_adjusted_mean': control_adjusted,
+        'residual_sd': residual_sd,
+        'ai_raw_mean': y_ai, 'control_raw_mean': y_ctl, 'raw_effect_size': raw_effect,
+        'ai_baseline_mean': x_ai, 'control_baseline_mean': x_ctl,
+        'intercept': y_ai - slope * x_ai, 'group_coef': (y_ctl - y_ai) - slope * (x_ctl - x_ai),
+        'slope': slope, 'r_squared': 1 - rss / syy_all
+    }
+
+
+def _ancova_result(ancova, i, outcome_col, baseline_col):
+    """
+    Result dict for column pair i of _ancova_columns output, in the
+    run_baseline_adjusted_analysis layout.
+    """
+    if ancova['n_total'][i] < 10:
+        return {'error': 'Insufficient data for baseline-adjusted analysis'}
+    if ancova['n_ai'][i] == 0 or ancova['n_control'][i] == 0:
+        return {'error': 'Error in baseline-adjusted analysis: both groups need complete data'}
+
+    value = {key: values[i].item() for key, values in ancova.items()}
+    adjusted_mean_diff = value['ai_adjusted_mean'] - value['control_adjusted_mean']
+    adjusted_effect_size = adjusted_mean_diff / value['residual_sd']
+
+    summary = '\n'.join([
+        f"ANCOVA (OLS): {outcome_col} ~ C(group) + {baseline_col}",
+        f"No. Observations: {value['n_total']}    R-squared: {value['r_squared']:.3f}",
+        f"Group F (Type II): {value['f_stat']:.4f}    p = {value['p_value']:.4g}",
+        f"{'Intercept':<22}{value['intercept']:>12.4f}",
+        f"{'C(group)[T.Control]':<22}{value['group_coef']:>12.4f}",
+        f"{baseline_col:<22}{value['slope']:>12.4f}",
+    ])
+
+    return {
+        'n_total': value['n_total'],
+        'n_ai': value['n_ai'],
+        'n_control': value['n_control'],
+
+        # ANCOVA results
+        'ancova_f_stat': value['f_stat'],
+        'ancova_p_value': value['p_value'],
+        'significant': value['p_value'] < 0.05,
+
+        # Adjusted results
+        'ai_adjusted_mean': value['ai_adjusted_mean'],
+        'control_adjusted_mean': value['control_adjusted_mean'],
+        'adjusted_mean_difference': adjusted_mean_diff,
+        'adjusted_effect_size': adjusted_effect_size,
+        'adjusted_effect_interpretation': interpret_effect_size(adjusted_effect_size),
+
+        # Raw results for comparison
+        'ai_raw_mean': value['ai_raw_mean'],
+        'control_raw_mean': value['control_raw_mean'],
+        'raw_effect_size': value['raw_effect_size'],
+        'raw_effect_interpretation': interpret_effect_size(value['raw_effect_size']),
+
+        # Baseline information
+        'ai_baseline_mean': value['ai_baseline_mean'],
+        'control_baseline_mean': value['control_baseline_mean'],
+        'baseline_difference': value['ai_baseline_mean'] - value['control_baseline_mean'],
+
+        # Model diagnostics
+        'r_squared': value['r_squared'],
+        'residual_std_error': value['residual_sd'],
+        'model_summary': summary
+    }
+
+
 def run_baseline_adjusted_analysis(data, outcome_col, baseline_col, group_col='group'):
     """
     Run baseline-adjusted analysis using ANCOVA-style approach.
@@ -468,109 +1072,19 @@ def run_baseline_adjusted_analysis(data, outcome_col, baseline_col, group_col='g
     dict : Baseline-adjusted analysis results
     """
     try:
-        # Try to import statsmodels for proper ANCOVA
-        from statsmodels.stats.anova import anova_lm
-        from statsmodels.formula.api import ols
-        import statsmodels.api as sm
-
-        # Clean data - remove missing values
-        analysis_data = data[[outcome_col, baseline_col, group_col]].dropna()
+        # outcome ~ C(group) + baseline, solved in closed form (see _ancova_columns)
+        baseline = data[[baseline_col]].to_numpy(dtype=np.float64, na_value=np.nan)
+        outcome = data[[outcome_col]].to_numpy(dtype=np.float64, na_value=np.nan)
+        ancova = _ancova_columns(data[group_col], baseline, outcome)
+        return _ancova_result(ancova, 0, outcome_col, baseline_col)
 
-        if len(analysis_data) < 10:
-            return {'error': 'Insufficient data for baseline-adjusted analysis'}
-
-        # Fit ANCOVA model: outcome ~ group + baseline
-        formula = f'{outcome_col} ~ C({group_col}) + {baseline_col}'
-        model = ols(formula, data=analysis_data).fit()
-
-        # Get ANOVA table
-        anova_results = anova_lm(model, typ=2)
-
-        # Extract group effect results
-        group_p_value = anova_results.loc[f'C({group_col})', 'PR(>F)']
-        group_f_stat = anova_results.loc[f'C({group_col})', 'F']
-
-        # Calculate adjusted means (least squares means)
-        # Get group coefficients from model
-        group_coef = model.params.get(
-            'C(group)[T.Control]', 0)  # Control vs AI
-        baseline_coef = model.params[baseline_col]
-        intercept = model.params['Intercept']
-
-        # Calculate overall baseline mean for adjustment
-        baseline_mean = analysis_data[baseline_col].mean()
-
-        # Adjusted means (at mean baseline value)
-        ai_adjusted_mean = intercept + baseline_coef * baseline_mean
-        control_adjusted_mean = intercept + group_coef + baseline_coef * baseline_mean
-
-        # Calculate baseline-adjusted effect size
-        pooled_residual_sd = np.sqrt(model.mse_resid)
-        adjusted_mean_diff = ai_adjusted_mean - control_adjusted_mean
-        adjusted_effect_size = adjusted_mean_diff / pooled_residual_sd
-
-        # Get raw group means for comparison
-        ai_raw = analysis_data[analysis_data[group_col]
-                               == 'AI'][outcome_col].mean()
-        control_raw = analysis_data[analysis_data[group_col]
-                                    == 'Control'][outcome_col].mean()
-        raw_effect_size = calculate_effect_size(
-            analysis_data[analysis_data[group_col] == 'AI'][outcome_col],
-            analysis_data[analysis_data[group_col] == 'Control'][outcome_col]
-        )
-
-        # Calculate baseline difference for context
-        ai_baseline = analysis_data[analysis_data[group_col]
-                                    == 'AI'][baseline_col].mean()
-        control_baseline = analysis_data[analysis_data[group_col]
-                                         == 'Control'][baseline_col].mean()
-        baseline_difference = ai_baseline - control_baseline
-
-        return {
-            'n_total': len(analysis_data),
-            'n_ai': len(analysis_data[analysis_data[group_col] == 'AI']),
-            'n_control': len(analysis_data[analysis_data[group_col] == 'Control']),
-
-            # ANCOVA results
-            'ancova_f_stat': group_f_stat,
-            'ancova_p_value': group_p_value,
-            'significant': group_p_value < 0.05,
-
-            # Adjusted results
-            'ai_adjusted_mean': ai_adjusted_mean,
-            'control_adjusted_mean': control_adjusted_mean,
-            'adjusted_mean_difference': adjusted_mean_diff,
-            'adjusted_effect_size': adjusted_effect_size,
-            'adjusted_effect_interpretation': interpret_effect_size(adjusted_effect_size),
-
-            # Raw results for comparison
-            'ai_raw_mean': ai_raw,
-            'control_raw_mean': control_raw,
-            'raw_effect_size': raw_effect_size,
-            'raw_effect_interpretation': interpret_effect_size(raw_effect_size),
-
-            # Baseline information
-            'ai_baseline_mean': ai_baseline,
-            'control_baseline_mean': control_baseline,
-            'baseline_difference': baseline_difference,
-
-            # Model diagnostics
-            'r_squared': model.rsquared,
-            'residual_std_error': pooled_residual_sd,
-            'model_summary': str(model.summary())
-        }
-
-    except ImportError:
-        # Fallback approach without statsmodels
-        return run_baseline_adjusted_fallback(data, outcome_col, baseline_col, group_col)
     except Exception as e:
         return {'error': f'Error in baseline-adjusted analysis: {str(e)}'}
 
 
 def run_baseline_adjusted_fallback(data, outcome_col, baseline_col, group_col='group'):
     """
-    Fallback baseline-adjusted analysis without statsmodels.
-    Uses residual scores approach.
+    Alternative baseline-adjusted analysis using the residual scores approach.
 
     Parameters:
     -----------
@@ -595,59 +1109,53 @@ def run_baseline_adjusted_fallback(data, outcome_col, baseline_col, group_col='g
             return {'error': 'Insufficient data for baseline-adjusted analysis'}
 
         # Method: Linear regression to predict post from pre, then analyze residuals
-        from scipy import stats as scipy_stats
-
-        # Fit regression: post ~ pre (across all participants)
-        x = analysis_data[baseline_col].values
-        y = analysis_data[outcome_col].values
+        x = analysis_data[baseline_col].to_numpy(dtype=np.float64)
+        y = analysis_data[outcome_col].to_numpy(dtype=np.float64)
 
-        slope, intercept, r_value, p_value, std_err = scipy_stats.linregress(
-            x, y)
+        # Fit regression: post ~ pre (across all participants), from centred sums
+        dx = x - x.mean()
+        dy = y - y.mean()
+        sxx, sxy, syy = dx @ dx, dx @ dy, dy @ dy
+        slope = sxy / sxx
+        r_value = sxy / np.sqrt(sxx * syy)
 
         # Calculate residuals (baseline-adjusted scores)
-        predicted = slope * x + intercept
-        residuals = y - predicted
-
-        # Add residuals to dataframe
-        analysis_data = analysis_data.copy()
-        analysis_data['baseline_adjusted_score'] = residuals
+        residuals = dy - slope * dx
 
         # Compare residuals between groups
-        ai_residuals = analysis_data[analysis_data[group_col]
-                                     == 'AI']['baseline_adjusted_score']
-        control_residuals = analysis_data[analysis_data[group_col]
-                                          == 'Control']['baseline_adjusted_score']
+        ai_mask, control_mask = _group_masks(analysis_data[group_col])
+        ai_residuals = residuals[ai_mask]
+        control_residuals = residuals[control_mask]
 
         # Statistical test on residuals
         t_stat, p_val = ttest_ind(ai_residuals, control_residuals)
         effect_size = calculate_effect_size(ai_residuals, control_residuals)
 
+        # Residual, outcome and baseline means for both groups from bincount
+        # sums (code 0 = AI, 1 = Control, 2 = any other label)
+        codes = np.where(ai_mask, 0, np.where(control_mask, 1, 2))
+        counts = np.bincount(codes, minlength=3)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            residual_means = np.bincount(codes, weights=residuals, minlength=3) / counts
+            outcome_means = np.bincount(codes, weights=y, minlength=3) / counts
+            baseline_means = np.bincount(codes, weights=x, minlength=3) / counts
+        ai_adjusted, control_adjusted = residual_means[:2]
+        ai_raw, control_raw = outcome_means[:2]
+        ai_baseline, control_baseline = baseline_means[:2]
+
         # Raw comparison for context
-        ai_raw = analysis_data[analysis_data[group_col]
-                               == 'AI'][outcome_col].mean()
-        control_raw = analysis_data[analysis_data[group_col]
-                                    == 'Control'][outcome_col].mean()
-        raw_effect_size = calculate_effect_size(
-            analysis_data[analysis_data[group_col] == 'AI'][outcome_col],
-            analysis_data[analysis_data[group_col] == 'Control'][outcome_col]
-        )
-
-        # Baseline info
-        ai_baseline = analysis_data[analysis_data[group_col]
-                                    == 'AI'][baseline_col].mean()
-        control_baseline = analysis_data[analysis_data[group_col]
-                                         == 'Control'][baseline_col].mean()
+        raw_effect_size = calculate_effect_size(y[ai_mask], y[control_mask])
 
         return {
             'method': 'residual_scores',
             'n_total': len(analysis_data),
-            'n_ai': len(ai_residuals),
-            'n_control': len(control_residuals),
+            'n_ai': int(counts[0]),
+            'n_control': int(counts[1]),
 
             # Adjusted results
-            'ai_adjusted_mean': ai_residuals.mean(),
-            'control_adjusted_mean': control_residuals.mean(),
-            'adjusted_mean_difference': ai_residuals.mean() - control_residuals.mean(),
+            'ai_adjusted_mean': ai_adjusted,
+            'control_adjusted_mean': control_adjusted,
+            'adjusted_mean_difference': ai_adjusted - control_adjusted,
             'adjusted_effect_size': effect_size,
             'adjusted_effect_interpretation': interpret_effect_size(effect_size),
             'adjusted_t_stat': t_stat,
@@ -690,27 +1198,34 @@ def run_dimensional_baseline_adjusted_analysis(participant_data):
     from data_processing import get_self_efficacy_dimensions
 
     dimensions = get_self_efficacy_dimensions()
-    adjusted_results = {}
+    columns = set(participant_data.columns)
+
+    # (label, number, pre, post) for every dimension present, then overall
+    pairs = [
+        (label, number, f'pre_se_{label}', f'post_se_{label}')
+        for number, label in dimensions.items()
+        if f'pre_se_{label}' in columns and f'post_se_{label}' in columns
+    ]
+    if 'pre_self_efficacy' in columns and 'post_self_efficacy' in columns:
+        pairs.append(('overall', None, 'pre_self_efficacy', 'post_self_efficacy'))
+
+    if not pairs:
+        return {}
+
+    # One ANCOVA fit for all dimensions: every pair shares the group column,
+    # so the per-group sums are reduced column-wise in a single pass
+    baseline = participant_data[[pre for _, _, pre, _ in pairs]].to_numpy(
+        dtype=np.float64, na_value=np.nan)
+    outcome = participant_data[[post for _, _, _, post in pairs]].to_numpy(
+        dtype=np.float64, na_value=np.nan)
+    ancova = _ancova_columns(participant_data['group'], baseline, outcome)
 
-    for dimension_num, dimension_label in dimensions.items():
-        pre_col = f'pre_se_{dimension_label}'
-        post_col = f'post_se_{dimension_label}'
-
-        if pre_col in participant_data.columns and post_col in participant_data.columns:
-            # Run baseline-adjusted analysis for this dimension
-            dim_results = run_baseline_adjusted_analysis(
-                participant_data, post_col, pre_col, 'group'
-            )
-            dim_results['dimension_label'] = dimension_label
-            dim_results['dimension_number'] = dimension_num
-            adjusted_results[dimension_label] = dim_results
-
-    # Overall self-efficacy
-    if 'pre_self_efficacy' in participant_data.columns and 'post_self_efficacy' in participant_data.columns:
-        overall_results = run_baseline_adjusted_analysis(
-            participant_data, 'post_self_efficacy', 'pre_self_efficacy', 'group'
-        )
-        overall_results['dimension_label'] = 'overall'
-        adjusted_results['overall'] = overall_results
+    adjusted_results = {}
+    for i, (label, number, pre_col, post_col) in enumerate(pairs):
+        dim_results = _ancova_result(ancova, i, post_col, pre_col)
+        dim_results['dimension_label'] = label
+        if number is not None:
+            dim_results['dimension_number'] = number
+        adjusted_results[label] = dim_results
 
     return adjusted_results
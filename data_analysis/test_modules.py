@@ -99,6 +99,45 @@ def test_with_dummy_data():
         traceback.print_exc()
         return False
 
+def test_case_processing():
+    """Test that vectorized case processing matches the row-wise helper."""
+    print("\nTesting case processing...")
+
+    try:
+        import json
+        import pandas as pd
+        from data_processing import process_case_data, process_participant_row
+
+        pre = {f'selfEfficacy{i}': i % 5 + 1 for i in range(1, 8)}
+        post = dict(pre, selfEfficacy3=None, stress=2, helpfulness=4)
+        raw_data = pd.DataFrame({
+            'ID': ['p1', 'p1', 'p2'],
+            'Branch': ['branch-a', 'branch-a', 'branch-b'],
+            'Case ID': [1, 2, 1],
+            'Sequence': [0, 1, 0],
+            'Age': [30, 30, 22],
+            'Education': ['BSc', 'BSc', 'MSc'],
+            'Ethnicity': ['A', 'A', 'B'],
+            'Time Taken': [60.0, 75.0, 90.0],
+            'Pre Questions': [json.dumps(pre)] * 3,
+            'Post Questions': [json.dumps(post), 'not json', json.dumps(post)],
+            'Pre Confidence': [3, 4, 2],
+            'Post Confidence': [4, 4, 3],
+            'Post Stress': [2.0, None, 3.0]
+        })
+
+        vectorized = process_case_data(raw_data)
+        row_wise = pd.DataFrame([process_participant_row(row) for _, row in raw_data.iterrows()])
+        pd.testing.assert_frame_equal(vectorized, row_wise, check_dtype=False)
+        print(f"✅ Vectorized case processing matches row-wise: {vectorized.shape}")
+
+        return True
+    except Exception as e:
+        print(f"❌ Case processing test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -115,7 +154,10 @@ def main():
     
     # Test with dummy data
     all_passed &= test_with_dummy_data()
-    
+
+    # Test case processing
+    all_passed &= test_case_processing()
+
     print("\n" + "=" * 60)
     if all_passed:
         print("🎉 ALL TESTS PASSED!")
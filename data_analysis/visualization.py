@@ -7,43 +7,68 @@ Visualization Module for AI-Assisted Empathetic Communication Analysis
 Contains all plotting functions for creating publication-ready figures.
 """
 
+import functools
+
 import pandas as pd
 import numpy as np
 
-# Try to import visualization libraries
-try:
-    import matplotlib.pyplot as plt
-    import seaborn as sns
-    from scipy.stats import ttest_ind
-    VISUALIZATION_AVAILABLE = True
-except ImportError:
-    VISUALIZATION_AVAILABLE = False
+from config import COLORS, FIGURE_FORMATS, FIGURE_DPI, ensure_plot_style, visualization_available
+
+# matplotlib, seaborn and the SciPy-backed statistics helpers are imported on
+# first use, so importing this module (e.g. for the dimension ordering
+# helpers) does not pay their import cost
+VISUALIZATION_AVAILABLE = visualization_available()
+if not VISUALIZATION_AVAILABLE:
     print("Warning: matplotlib, seaborn, or scipy not available. Visualization features disabled.")
 
-from config import COLORS, FIGURE_FORMATS, FIGURE_DPI
-from statistical_analysis import calculate_effect_size, interpret_effect_size
+plt = sns = Figure = LineCollection = ttest_ind = ttest_ind_from_stats = None
+calculate_effect_size = calculate_effect_size_from_stats = interpret_effect_size = None
+
+
+def _load_visualization_libraries():
+    """Import the plotting and statistics libraries into module globals once."""
+    global plt, sns, Figure, LineCollection, ttest_ind, ttest_ind_from_stats
+    global calculate_effect_size, calculate_effect_size_from_stats, interpret_effect_size
+    if plt is not None:
+        return
+
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+    from scipy.stats import ttest_ind, ttest_ind_from_stats
+    from statistical_analysis import (calculate_effect_size, calculate_effect_size_from_stats,
+                                      interpret_effect_size)
+    ensure_plot_style()
 
 
 def require_visualization(func):
     """Decorator to check if visualization libraries are available."""
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         if not VISUALIZATION_AVAILABLE:
             print(
                 f"❌ {func.__name__} requires matplotlib and seaborn. Please install them.")
             return None
+        _load_visualization_libraries()
         return func(*args, **kwargs)
     return wrapper
 
 
+# Standard dimension order shared by all figures (read-only)
+STANDARD_DIMENSION_ORDER = ('overall', 'empathetic', 'clear', 'appropriate',
+                            'accurate', 'helpful', 'complete', 'relevant')
+
+
 def get_standard_dimension_order():
     """
     Get the standardized order for self-efficacy dimensions across all visualizations.
 
     Returns:
     --------
-    list : Ordered list of dimension labels
+    tuple : Ordered dimension labels (shared, immutable)
     """
-    return ['overall', 'empathetic', 'clear', 'appropriate', 'accurate', 'helpful', 'complete', 'relevant']
+    return STANDARD_DIMENSION_ORDER
 
 
 def sort_dimensions_by_standard_order(dimension_data, key_func=None):
@@ -77,20 +102,102 @@ def sort_dimensions_by_standard_order(dimension_data, key_func=None):
             # Assume items are dimension names
             return [dim for dim in standard_order if dim in dimension_data]
         else:
-            # Sort items using key function
-            sorted_items = []
-            for dim in standard_order:
-                for item in dimension_data:
-                    if key_func(item) == dim:
-                        sorted_items.append(item)
-                        break
-            return sorted_items
+            # Sort items using key function (first item per dimension wins)
+            by_dimension = {}
+            for item in dimension_data:
+                by_dimension.setdefault(key_func(item), item)
+            return [by_dimension[dim] for dim in standard_order if dim in by_dimension]
 
     return dimension_data
 
 
+def _group_views(data, group_col='group'):
+    """
+    Rows of the AI and Control groups, split in one groupby pass.
+
+    Parameters:
+    -----------
+    data : pandas.DataFrame
+        Data with a group column
+    group_col : str
+        Group assignment column name
+
+    Returns:
+    --------
+    dict : 'AI' and 'Control' -> DataFrame of that group's rows (empty if absent)
+    """
+    grouped = dict(list(data.groupby(group_col, sort=False, observed=True)))
+    return {group: grouped.get(group, data.iloc[:0]) for group in ('AI', 'Control')}
+
+
+def _mean_std(values):
+    """Mean and sample standard deviation (ddof=1, NaN below two values) of an array."""
+    return values.mean(), (values.std(ddof=1) if values.size > 1 else np.nan)
+
+
+def _box_stats(values, label, whis=1.5):
+    """
+    Box-and-whisker statistics of a NaN-free array for Axes.bxp.
+
+    Matches what Axes.boxplot computes (Tukey whiskers at ``whis`` * IQR,
+    points beyond them as fliers) with the quartiles taken in one call.
+    """
+    if values.size == 0:
+        return {'label': label, 'mean': np.nan, 'med': np.nan, 'q1': np.nan, 'q3': np.nan,
+                'whislo': np.nan, 'whishi': np.nan, 'fliers': values}
+
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    upper = values[values <= q3 + whis * iqr]
+    lower = values[values >= q1 - whis * iqr]
+    whishi = upper.max() if upper.size and upper.max() >= q3 else q3
+    whislo = lower.min() if lower.size and lower.min() <= q1 else q1
+    return {'label': label, 'mean': values.mean(), 'med': med, 'q1': q1, 'q3': q3,
+            'whislo': whislo, 'whishi': whishi,
+            'fliers': values[(values < whislo) | (values > whishi)]}
+
+
+def _dimension_effect_sizes(participant_data):
+    """
+    Cohen's d of every dimension change score from one grouped aggregate.
+
+    Matches the 'effect_size' of analyze_self_efficacy_dimensions: the first
+    group in order of appearance minus the second, pooled SD with ddof=1,
+    and no result unless there are exactly two groups.
+
+    Parameters:
+    -----------
+    participant_data : pandas.DataFrame
+        Participant-level data with se_change_* columns
+
+    Returns:
+    --------
+    tuple : (list of display labels, numpy array of effect sizes)
+    """
+    from data_processing import get_self_efficacy_dimensions
+
+    labels = [label for label in get_self_efficacy_dimensions().values()
+              if f'se_change_{label}' in participant_data.columns]
+    groups = participant_data['group']
+    if not labels or groups.hasnans or groups.nunique() != 2:
+        return [], np.array([])
+
+    change_cols = [f'se_change_{label}' for label in labels]
+    stats = participant_data.groupby('group', sort=False, observed=True)[change_cols].agg(
+        ['mean', 'var', 'count'])
+    first, second = (stats.iloc[i].unstack() for i in (0, 1))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pooled_var = (((first['count'] - 1) * first['var'] + (second['count'] - 1) * second['var'])
+                      / (first['count'] + second['count'] - 2))
+        effect_sizes = ((first['mean'] - second['mean']) / np.sqrt(pooled_var)).to_numpy(dtype=float)
+
+    return [label.title() for label in labels], effect_sizes
+
+
 @require_visualization
-def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
+def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir='',
+                                             dimension_results=None):
     """
     Plot pre-post trajectory for each self-efficacy dimension using faceted design.
     Creates a grid with separate subplot for each dimension.
@@ -101,6 +208,9 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
         Participant-level data with dimension scores
     output_dir : str
         Directory to save the plot
+    dimension_results : dict
+        Results from analyze_self_efficacy_dimensions for participant_data
+        (optional; without it the effect sizes come from a grouped aggregate)
 
     Returns:
     --------
@@ -120,11 +230,9 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
 
     # Add other dimensions in standard order
     # Skip 'overall' as we already added it
-    for dim_name in standard_order[1:]:
-        for dim_num, dim_label in dimensions.items():
-            if dim_label == dim_name:
-                ordered_dimensions.append((dim_num, dim_label))
-                break
+    label_to_num = {dim_label: dim_num for dim_num, dim_label in dimensions.items()}
+    ordered_dimensions.extend((label_to_num[dim_name], dim_name)
+                              for dim_name in standard_order[1:] if dim_name in label_to_num)
 
     # Create a 2x4 grid (7 dimensions + 1 overall plot)
     fig, axes = plt.subplots(2, 4, figsize=(20, 12))
@@ -133,6 +241,19 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
     # Define colors for groups
     colors = {'AI': COLORS['ai'], 'Control': COLORS['control']}
 
+    # Mean, std and count of every pre/post column per group in one pass
+    score_cols = [col for dim_label in (label for _, label in ordered_dimensions)
+                  for col in ((f'pre_se_{dim_label}', f'post_se_{dim_label}')
+                              if dim_label != 'overall'
+                              else ('pre_self_efficacy', 'post_self_efficacy'))
+                  if col in participant_data.columns]
+    group_stats = participant_data.groupby('group', observed=True)[score_cols].agg(
+        ['mean', 'std', 'count'])
+    group_stats = group_stats.join(
+        group_stats.xs('std', axis=1, level=1, drop_level=False).rename(columns={'std': 'se'})
+        / np.sqrt(group_stats.xs('count', axis=1, level=1, drop_level=False).to_numpy()))
+    overall_pre_means = participant_data[score_cols].mean()
+
     # Plot each dimension separately in standard order
     for dim_idx, (dim_num, dim_label) in enumerate(ordered_dimensions):
         if dim_idx >= len(axes):
@@ -151,18 +272,16 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
             title = dim_label.title()
 
         for group in ['AI', 'Control']:
-            group_data = participant_data[participant_data['group'] == group]
+            if (group in group_stats.index and pre_col in participant_data.columns
+                    and post_col in participant_data.columns):
+                # Means and standard errors from the grouped aggregate
+                stats_row = group_stats.loc[group]
 
-            if pre_col in group_data.columns and post_col in group_data.columns:
-                # Calculate means and standard errors
-                pre_scores = group_data[pre_col].dropna()
-                post_scores = group_data[post_col].dropna()
-
-                if len(pre_scores) > 0 and len(post_scores) > 0:
-                    pre_mean = pre_scores.mean()
-                    post_mean = post_scores.mean()
-                    pre_se = pre_scores.std() / np.sqrt(len(pre_scores))
-                    post_se = post_scores.std() / np.sqrt(len(post_scores))
+                if stats_row[(pre_col, 'count')] > 0 and stats_row[(post_col, 'count')] > 0:
+                    pre_mean = stats_row[(pre_col, 'mean')]
+                    post_mean = stats_row[(post_col, 'mean')]
+                    pre_se = stats_row[(pre_col, 'se')]
+                    post_se = stats_row[(post_col, 'se')]
 
                     # Add slight horizontal offset to avoid overlap
                     offset = 0.02 if group == 'AI' else -0.02
@@ -173,9 +292,10 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
                             markersize=10, label=group if dim_idx == 0 else "",
                             alpha=0.8)
 
-                    # Add error bars
+                    # Add error bars (bars and caps only; the line above
+                    # already connects the means)
                     ax.errorbar([0 + offset, 1 + offset], [pre_mean, post_mean],
-                                yerr=[pre_se, post_se],
+                                yerr=[pre_se, post_se], fmt='none',
                                 color=colors[group], alpha=0.6, capsize=5,
                                 linewidth=2)
 
@@ -197,10 +317,8 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
         ax.grid(True, alpha=0.3)
 
         # Add horizontal line at pre-intervention baseline
-        group_data_all = participant_data
-        if pre_col in group_data_all.columns:
-            overall_pre_mean = group_data_all[pre_col].dropna().mean()
-            ax.axhline(y=overall_pre_mean, color='gray',
+        if pre_col in overall_pre_means.index:
+            ax.axhline(y=overall_pre_means[pre_col], color='gray',
                        linestyle=':', alpha=0.5)
 
     # Use the last subplot for a summary/legend
@@ -208,17 +326,17 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
     summary_ax.axis('off')
 
     # Create summary effect sizes plot in the last subplot
-    from data_processing import analyze_self_efficacy_dimensions
     try:
-        dimension_results = analyze_self_efficacy_dimensions(participant_data)
-
         # Extract effect sizes
-        dim_labels = []
-        effect_sizes = []
-        for dim_label, results in dimension_results.items():
-            if 'error' not in results and 'effect_size' in results:
-                dim_labels.append(dim_label.title())
-                effect_sizes.append(results['effect_size'])
+        if dimension_results is None:
+            dim_labels, effect_sizes = _dimension_effect_sizes(participant_data)
+        else:
+            dim_labels = []
+            effect_sizes = []
+            for dim_label, results in dimension_results.items():
+                if 'error' not in results and 'effect_size' in results:
+                    dim_labels.append(dim_label.title())
+                    effect_sizes.append(results['effect_size'])
 
         if dim_labels:
             # Create mini bar chart
@@ -255,11 +373,12 @@ def plot_self_efficacy_dimensions_trajectory(participant_data, output_dir=''):
 
     # Add overall legend
     if len(dimensions) > 0:
+        group_views = _group_views(participant_data)
         legend_elements = [
             plt.Line2D([0], [0], color=colors['AI'], linewidth=3, marker='o',
-                       markersize=8, label=f'AI Group (n={len(participant_data[participant_data["group"] == "AI"])})'),
+                       markersize=8, label=f'AI Group (n={len(group_views["AI"])})'),
             plt.Line2D([0], [0], color=colors['Control'], linewidth=3, marker='o',
-                       markersize=8, label=f'Control Group (n={len(participant_data[participant_data["group"] == "Control"])})')
+                       markersize=8, label=f'Control Group (n={len(group_views["Control"])})')
         ]
         fig.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, 0.02),
                    ncol=2, fontsize=12)
@@ -298,7 +417,6 @@ def plot_self_efficacy_dimensions_change(participant_data, output_dir=''):
     fig, ax = plt.subplots(figsize=(14, 8))
 
     # Prepare data for plotting in standard order
-    plot_data = []
     ordered_dimensions = []
 
     # Add overall if it exists
@@ -306,12 +424,12 @@ def plot_self_efficacy_dimensions_change(participant_data, output_dir=''):
         ordered_dimensions.append(('overall', 'overall'))
 
     # Add other dimensions in standard order
-    for dim_name in standard_order[1:]:  # Skip 'overall'
-        for dim_num, dim_label in dimensions.items():
-            if dim_label == dim_name:
-                ordered_dimensions.append((dim_num, dim_label))
-                break
+    label_to_num = {dim_label: dim_num for dim_num, dim_label in dimensions.items()}
+    ordered_dimensions.extend((label_to_num[dim_name], dim_name)
+                              for dim_name in standard_order[1:]  # Skip 'overall'
+                              if dim_name in label_to_num)
 
+    display_names = {}
     for dim_num, dim_label in ordered_dimensions:
         if dim_label == 'overall':
             change_col = 'self_efficacy_change'
@@ -321,18 +439,14 @@ def plot_self_efficacy_dimensions_change(participant_data, output_dir=''):
             display_name = dim_label.title()
 
         if change_col in participant_data.columns:
-            for group in ['AI', 'Control']:
-                group_data = participant_data[participant_data['group'] == group]
-                change_scores = group_data[change_col].dropna()
+            display_names[change_col] = display_name
 
-                for score in change_scores:
-                    plot_data.append({
-                        'dimension': display_name,
-                        'group': group,
-                        'change_score': score
-                    })
-
-    plot_df = pd.DataFrame(plot_data)
+    # Long format (dimension, group, change_score) for both groups in one reshape
+    in_groups = participant_data['group'].isin(['AI', 'Control'])
+    plot_df = participant_data.loc[in_groups, ['group', *display_names]].melt(
+        id_vars='group', var_name='dimension', value_name='change_score'
+    ).dropna(subset=['change_score'])
+    plot_df['dimension'] = plot_df['dimension'].map(display_names)
 
     if len(plot_df) > 0:
         # Create box plot with standard order
@@ -343,7 +457,9 @@ def plot_self_efficacy_dimensions_change(participant_data, output_dir=''):
 
         sns.boxplot(data=plot_df, x='dimension', y='change_score', hue='group',
                     palette=[COLORS['ai'], COLORS['control']], ax=ax,
-                    order=dimension_order)
+                    order=dimension_order,
+                    hue_order=[group for group in ['AI', 'Control']
+                               if group in set(plot_df['group'])])
 
         # Add horizontal line at zero
         ax.axhline(y=0, color='black', linestyle='--', alpha=0.5)
@@ -359,9 +475,9 @@ def plot_self_efficacy_dimensions_change(participant_data, output_dir=''):
         plt.xticks(rotation=45, ha='right')
 
         # Add sample sizes to legend
-        ai_n = len(participant_data[participant_data['group'] == 'AI'])
-        control_n = len(
-            participant_data[participant_data['group'] == 'Control'])
+        group_views = _group_views(participant_data)
+        ai_n = len(group_views['AI'])
+        control_n = len(group_views['Control'])
 
         handles, labels = ax.get_legend_handles_labels()
         new_labels = [f'AI (n={ai_n})', f'Control (n={control_n})']
@@ -399,7 +515,6 @@ def plot_self_efficacy_dimensions_effect_sizes(dimension_results, output_dir='')
 
     dimensions = []
     effect_sizes = []
-    p_values = []
     significance = []
 
     # Process dimensions in standard order
@@ -412,59 +527,57 @@ def plot_self_efficacy_dimensions_effect_sizes(dimension_results, output_dir='')
                 effect_sizes.append(results['effect_size'])
                 p_val = results.get('recommended_p', results.get(
                     't_test', {}).get('p_value', 1.0))
-                p_values.append(p_val)
                 significance.append('*' if p_val < 0.05 else '')
 
     if dimensions:
-        # Reverse order for horizontal bar plot (so 'Overall' appears at top)
+        # Reverse order for horizontal bar plot (so 'Overall' appears at top);
+        # bars are centred on y_pos and as wide as their effect size
         dimensions = dimensions[::-1]
-        effect_sizes = effect_sizes[::-1]
-        p_values = p_values[::-1]
+        effect_sizes = np.asarray(effect_sizes, dtype=np.float64)[::-1]
         significance = significance[::-1]
+        positive = effect_sizes > 0
 
         # Create horizontal bar plot
         y_pos = np.arange(len(dimensions))
-        bars = ax.barh(y_pos, effect_sizes,
-                       color=[COLORS['ai'] if es > 0 else COLORS['control']
-                              for es in effect_sizes],
-                       alpha=0.7)
+        ax.barh(y_pos, effect_sizes,
+                color=np.where(positive, COLORS['ai'], COLORS['control']),
+                alpha=0.7, tick_label=dimensions)
 
         # Add vertical line at zero
         ax.axvline(x=0, color='black', linestyle='-', alpha=0.5)
 
-        # Add effect size magnitude lines
-        ax.axvline(x=0.2, color='gray', linestyle='--',
-                   alpha=0.3, label='Small effect')
-        ax.axvline(x=0.5, color='gray', linestyle='--',
-                   alpha=0.5, label='Medium effect')
-        ax.axvline(x=0.8, color='gray', linestyle='--',
-                   alpha=0.7, label='Large effect')
-        ax.axvline(x=-0.2, color='gray', linestyle='--', alpha=0.3)
-        ax.axvline(x=-0.5, color='gray', linestyle='--', alpha=0.5)
-        ax.axvline(x=-0.8, color='gray', linestyle='--', alpha=0.7)
+        # Add effect size magnitude lines at ±d, one collection per magnitude;
+        # like axvline they span the full height (x in data, y in axes units)
+        for magnitude, alpha, label in [(0.2, 0.3, 'Small effect'),
+                                        (0.5, 0.5, 'Medium effect'),
+                                        (0.8, 0.7, 'Large effect')]:
+            ax.add_collection(LineCollection(
+                [[(magnitude, 0), (magnitude, 1)], [(-magnitude, 0), (-magnitude, 1)]],
+                transform=ax.get_xaxis_transform(), colors='gray',
+                linestyles='--', alpha=alpha, label=label), autolim=False)
+        ax.update_datalim([(-0.8, 0), (0.8, 0)], updatey=False)
+        ax.autoscale_view(scaley=False)
 
         # Customize plot
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(dimensions)
         ax.set_xlabel('Effect Size (Cohen\'s d)', fontsize=12)
         ax.set_ylabel('Self-Efficacy Dimension', fontsize=12)
         ax.set_title('Effect Sizes: AI vs Control by Self-Efficacy Dimension',
                      fontsize=14, fontweight='bold')
 
         # Add significance annotations
-        for i, (bar, sig) in enumerate(zip(bars, significance)):
+        for y, es, is_positive, sig in zip(y_pos, effect_sizes, positive, significance):
             if sig:
-                ax.text(bar.get_width() + 0.02 if bar.get_width() > 0 else bar.get_width() - 0.02,
-                        bar.get_y() + bar.get_height()/2, sig,
-                        ha='left' if bar.get_width() > 0 else 'right',
+                ax.text(es + 0.02 if is_positive else es - 0.02, y, sig,
+                        ha='left' if is_positive else 'right',
                         va='center', fontsize=14, fontweight='bold')
 
-        # Add effect size values
-        for i, (bar, es) in enumerate(zip(bars, effect_sizes)):
-            ax.text(bar.get_width()/2 if abs(bar.get_width()) > 0.1 else (0.15 if bar.get_width() > 0 else -0.15),
-                    bar.get_y() + bar.get_height()/2, f'{es:.3f}',
+        # Add effect size values (inside the bar when it is wide enough)
+        wide = np.abs(effect_sizes) > 0.1
+        label_x = np.where(wide, effect_sizes / 2, np.where(positive, 0.15, -0.15))
+        for y, x, es, is_wide in zip(y_pos, label_x, effect_sizes, wide):
+            ax.text(x, y, f'{es:.3f}',
                     ha='center', va='center', fontweight='bold',
-                    color='white' if abs(bar.get_width()) > 0.1 else 'black')
+                    color='white' if is_wide else 'black')
 
         ax.legend(loc='lower right')
         ax.grid(True, alpha=0.3, axis='x')
@@ -502,9 +615,35 @@ def save_figure(fig, filename, formats=None, dpi=None):
     for fmt in formats:
         fig.savefig(f"{filename}.{fmt}", dpi=dpi, bbox_inches='tight',
                     format=fmt, facecolor='white', edgecolor='none')
+    # Remember where the figure went so close_figure can report it
+    fig.set_label(str(filename))
     print(f"📁 Saved: {filename}.{', '.join(formats)}")
 
 
+def close_figure(fig):
+    """
+    Close a figure so pyplot no longer keeps it alive.
+
+    Pipelines should close figures once they are saved and keep only the
+    returned path; holding Figure objects grows memory with every plot.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure or None
+        Figure to close
+
+    Returns:
+    --------
+    str or None : Base filename the figure was saved under, if any
+    """
+    if fig is None:
+        return None
+    _load_visualization_libraries()
+    path = fig.get_label() or None
+    plt.close(fig)
+    return path
+
+
 @require_visualization
 def plot_group_comparison(data, measure='self_efficacy_change', title=None, save_name=None):
     """
@@ -541,9 +680,12 @@ def plot_group_comparison(data, measure='self_efficacy_change', title=None, save
     sns.violinplot(data=data, x='group', y=measure, ax=ax2,
                    palette=[COLORS['ai'], COLORS['control']])
 
+    # Split the groups once for the means and the annotation
+    group_views = _group_views(data)
+
     # Add means
     for i, group in enumerate(['AI', 'Control']):
-        group_data = data[data['group'] == group][measure].dropna()
+        group_data = group_views[group][measure].dropna()
         if len(group_data) > 0:
             mean_val = group_data.mean()
             ax2.plot(i, mean_val, 'ko', markersize=8, markerfacecolor='white',
@@ -555,8 +697,8 @@ def plot_group_comparison(data, measure='self_efficacy_change', title=None, save
     ax2.legend()
 
     # Add statistical annotation
-    ai_data = data[data['group'] == 'AI'][measure].dropna()
-    control_data = data[data['group'] == 'Control'][measure].dropna()
+    ai_data = group_views['AI'][measure].dropna()
+    control_data = group_views['Control'][measure].dropna()
 
     if len(ai_data) > 0 and len(control_data) > 0:
         effect_size = calculate_effect_size(ai_data, control_data)
@@ -595,37 +737,37 @@ def plot_pre_post_comparison(data, save_name=None):
     """
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    # Prepare data for plotting
-    plot_data = []
-    for _, row in data.iterrows():
-        if not pd.isna(row['pre_self_efficacy']) and not pd.isna(row['post_self_efficacy']):
-            plot_data.extend([
-                {'Group': row['group'], 'Time': 'Pre',
-                 'Score': row['pre_self_efficacy'], 'ID': row['participant_id']},
-                {'Group': row['group'], 'Time': 'Post',
-                 'Score': row['post_self_efficacy'], 'ID': row['participant_id']}
-            ])
+    # Prepare data for plotting: participants with both time points, in long format
+    complete = data.dropna(subset=['pre_self_efficacy', 'post_self_efficacy'])
 
-    if not plot_data:
+    if complete.empty:
         print("Warning: No valid pre-post data found for plotting")
         return fig
 
-    plot_df = pd.DataFrame(plot_data)
+    plot_df = complete.melt(
+        id_vars=['group', 'participant_id'],
+        value_vars=['pre_self_efficacy', 'post_self_efficacy'],
+        var_name='Time', value_name='Score'
+    ).rename(columns={'group': 'Group', 'participant_id': 'ID'})
+    plot_df['Time'] = plot_df['Time'].map(
+        {'pre_self_efficacy': 'Pre', 'post_self_efficacy': 'Post'})
 
-    # Create the plot
+    # Create the plot; the 95% interval is the closed-form mean +/- 1.96 SE
+    # rather than seaborn's default 1000-resample bootstrap
     sns.pointplot(data=plot_df, x='Time', y='Score', hue='Group',
                   palette=[COLORS['ai'], COLORS['control']],
-                  markers=['o', 's'], linestyles=['-', '--'], ax=ax)
+                  markers=['o', 's'], linestyles=['-', '--'],
+                  errorbar=('se', 1.96), ax=ax)
 
-    # Add individual trajectories (faded)
+    # Add individual trajectories (faded), one collection per group; the
+    # categorical axis puts Pre at x=0 and Post at x=1
+    group_views = _group_views(complete)
     for group, color in [('AI', COLORS['ai']), ('Control', COLORS['control'])]:
-        group_data = data[data['group'] == group]
-        for _, participant in group_data.iterrows():
-            if not pd.isna(participant['pre_self_efficacy']) and not pd.isna(participant['post_self_efficacy']):
-                ax.plot(['Pre', 'Post'],
-                        [participant['pre_self_efficacy'],
-                            participant['post_self_efficacy']],
-                        color=color, alpha=0.1, linewidth=0.5)
+        scores = group_views[group][['pre_self_efficacy', 'post_self_efficacy']].to_numpy(dtype=float)
+        if len(scores):
+            segments = np.stack([np.broadcast_to([0.0, 1.0], scores.shape), scores], axis=-1)
+            ax.add_collection(LineCollection(segments, colors=color, alpha=0.1, linewidths=0.5))
+    ax.autoscale_view()
 
     ax.set_title('Self-Efficacy Changes: Pre to Post Intervention')
     ax.set_ylabel('Self-Efficacy Score')
@@ -662,32 +804,28 @@ def plot_effect_size_forest(measures_dict, participant_data, save_name=None):
     fig, ax = plt.subplots(figsize=(10, 6))
 
     measure_names = list(measures_dict.keys())
-    effect_sizes = list(measures_dict.values())
+    effect_sizes = np.asarray(list(measures_dict.values()), dtype=np.float64)
 
     # Calculate confidence intervals (approximate)
     # For Cohen's d with equal n, SE ≈ sqrt(2/n + d²/(2*(2n-2)))
     n_approx = len(participant_data) // 2  # Approximate group size
-    conf_intervals = []
-
-    for d in effect_sizes:
-        if n_approx > 0:
-            se = np.sqrt(2/n_approx + d**2/(2*(2*n_approx-2)))
-            ci_lower = d - 1.96 * se
-            ci_upper = d + 1.96 * se
-        else:
-            ci_lower = ci_upper = d
-        conf_intervals.append((ci_lower, ci_upper))
+    if n_approx > 0:
+        with np.errstate(divide='ignore'):
+            se = np.sqrt(2/n_approx + effect_sizes**2/(2*(2*n_approx-2)))
+    else:
+        se = np.zeros_like(effect_sizes)
+    ci_lower = effect_sizes - 1.96 * se
+    ci_upper = effect_sizes + 1.96 * se
 
     y_pos = np.arange(len(measure_names))
 
     # Plot effect sizes
-    colors = [COLORS['ai'] if d > 0 else COLORS['control']
-              for d in effect_sizes]
+    colors = np.where(effect_sizes > 0, COLORS['ai'], COLORS['control'])
     ax.scatter(effect_sizes, y_pos, s=100, c=colors, alpha=0.7, zorder=3)
 
-    # Plot confidence intervals
-    for i, (d, (ci_lower, ci_upper)) in enumerate(zip(effect_sizes, conf_intervals)):
-        ax.plot([ci_lower, ci_upper], [i, i], 'k-', alpha=0.5, linewidth=2)
+    # Plot confidence intervals (one collection for all measures)
+    ax.hlines(y_pos, ci_lower, ci_upper, colors='k', alpha=0.5, linewidth=2,
+              capstyle='projecting')
 
     # Add vertical line at 0
     ax.axvline(x=0, color='black', linestyle='--', alpha=0.5)
@@ -736,7 +874,7 @@ def plot_power_analysis(effect_sizes, max_n=1000, target_n=600, save_name=None):
     --------
     matplotlib.figure.Figure : The created figure
     """
-    from statistical_analysis import power_analysis
+    from statistical_analysis import power_analysis_curve
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
@@ -748,10 +886,7 @@ def plot_power_analysis(effect_sizes, max_n=1000, target_n=600, save_name=None):
     colors = [COLORS['ai'], COLORS['control'], COLORS['neutral']]
 
     for i, effect_size in enumerate(effect_sizes):
-        power_values = []
-        for n in sample_sizes:
-            power_val = power_analysis(abs(effect_size), n//2)  # n/2 per group
-            power_values.append(power_val)
+        power_values = power_analysis_curve(abs(effect_size), sample_sizes // 2)  # n/2 per group
 
         color = colors[i % len(colors)]
         ax.plot(sample_sizes, power_values, linewidth=2, color=color,
@@ -799,14 +934,26 @@ def plot_correlation_matrix(data, variables, save_name=None):
     --------
     matplotlib.figure.Figure : The created figure
     """
-    # Filter to numeric variables and remove missing data
-    corr_data = data[variables].select_dtypes(include=[np.number])
-    correlation_matrix = corr_data.corr()
+    # Filter to numeric variables by dtype before subsetting (bools excluded,
+    # as with select_dtypes(include=np.number)); corr() skips missing pairs
+    numeric_cols = [col for col in variables
+                    if pd.api.types.is_numeric_dtype(data[col])
+                    and not pd.api.types.is_bool_dtype(data[col])]
+    values = data[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    if numeric_cols and len(values) > 1 and not np.isnan(values).any():
+        # Complete data: the Pearson matrix is one np.corrcoef call
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation_matrix = pd.DataFrame(np.corrcoef(values, rowvar=False),
+                                              index=numeric_cols, columns=numeric_cols)
+    else:
+        correlation_matrix = data[numeric_cols].corr()
 
     fig, ax = plt.subplots(figsize=(10, 8))
 
-    # Create heatmap
-    sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
+    # Create heatmap; beyond 20 variables the per-cell labels no longer fit
+    # in the 10x8 figure and only cost one Text artist per cell, so drop them
+    sns.heatmap(correlation_matrix, annot=len(correlation_matrix) <= 20,
+                cmap='coolwarm', center=0,
                 square=True, linewidths=0.5, cbar_kws={"shrink": 0.8}, ax=ax)
 
     ax.set_title('Correlation Matrix of Study Variables')
@@ -838,24 +985,29 @@ def plot_demographics_distribution(data, demographic_var, save_name=None):
     --------
     matplotlib.figure.Figure : The created figure
     """
+    var_label = demographic_var.replace("_", " ").title()
+    title = f'Distribution of {var_label} by Group'
+
     fig, ax = plt.subplots(figsize=(10, 6))
 
     if data[demographic_var].dtype in ['object', 'category']:
         # Categorical variable - create count plot
         sns.countplot(data=data, x=demographic_var, hue='group', ax=ax,
                       palette=[COLORS['ai'], COLORS['control']])
-        ax.set_title(
-            f'Distribution of {demographic_var.replace("_", " ").title()} by Group')
+        ax.set_title(title)
         plt.xticks(rotation=45, ha='right')
     else:
-        # Continuous variable - create histogram
+        # Continuous variable - create histograms on shared bin edges so the
+        # two groups' bars line up
+        group_views = _group_views(data)
+        group_values = {group: group_views[group][demographic_var].dropna().to_numpy(dtype=float)
+                        for group in ('AI', 'Control')}
+        edges = np.histogram_bin_edges(np.concatenate(list(group_values.values())), bins=10)
         for group, color in [('AI', COLORS['ai']), ('Control', COLORS['control'])]:
-            group_data = data[data['group'] == group][demographic_var].dropna()
-            ax.hist(group_data, alpha=0.7, label=group, color=color, bins=10)
+            ax.hist(group_values[group], alpha=0.7, label=group, color=color, bins=edges)
 
-        ax.set_title(
-            f'Distribution of {demographic_var.replace("_", " ").title()} by Group')
-        ax.set_xlabel(demographic_var.replace("_", " ").title())
+        ax.set_title(title)
+        ax.set_xlabel(var_label)
         ax.set_ylabel('Frequency')
         ax.legend()
 
@@ -869,7 +1021,7 @@ def plot_demographics_distribution(data, demographic_var, save_name=None):
 
 
 @require_visualization
-def quick_plot(measure, group_col='group', data=None):
+def quick_plot(measure, group_col='group', data=None, full=False):
     """
     Quick plotting function for exploratory analysis.
 
@@ -881,6 +1033,9 @@ def quick_plot(measure, group_col='group', data=None):
         Column name for grouping variable
     data : pandas.DataFrame
         Dataset (if None, will need to be passed)
+    full : bool
+        Plot every row. By default datasets over 5000 rows are reduced to a
+        reproducible random sample of at most 2500 rows per group.
 
     Returns:
     --------
@@ -889,6 +1044,14 @@ def quick_plot(measure, group_col='group', data=None):
     if data is None:
         raise ValueError("Data must be provided")
 
+    if not full and len(data) > 5000:
+        # Stratified subsample: shuffle once, keep the first 2500 rows per group
+        shuffled = data.sample(frac=1, random_state=0)
+        sample = shuffled[shuffled.groupby(group_col, observed=True).cumcount() < 2500]
+        print(f"ℹ️  quick_plot: showing a sample of {len(sample)} of {len(data)} rows "
+              "(pass full=True to plot all)")
+        data = sample
+
     fig, ax = plt.subplots(figsize=(8, 5))
     sns.boxplot(data=data, x=group_col, y=measure, ax=ax)
     ax.set_title(
@@ -916,9 +1079,24 @@ def plot_baseline_comparison(participant_data, output_dir=''):
 
     dimensions = get_self_efficacy_dimensions()
 
-    # Create figure with subplots: 2 rows x 4 columns (7 dimensions + overall)
-    fig, axes = plt.subplots(2, 4, figsize=(16, 10))
-    axes = axes.flatten()
+    # Group masks are built once and reused for every panel
+    group_labels = participant_data['group'].to_numpy()
+    ai_mask = group_labels == 'AI'
+    control_mask = group_labels == 'Control'
+
+    # Panel columns and titles: each available dimension, then the overall score
+    nrows, ncols = 2, 4
+    panels = [(f'pre_se_{label}', label.title()) for label in dimensions.values()
+              if f'pre_se_{label}' in participant_data.columns][:nrows * ncols]
+    if len(panels) < nrows * ncols:
+        panels.append(('pre_self_efficacy', 'Overall Baseline\n(Mean of All Dimensions)'))
+
+    # Create figure with subplots: 2 rows x 4 columns (7 dimensions + overall),
+    # adding axes only for the panels that are drawn. The figure is built
+    # outside pyplot so it is never registered with the figure manager; it is
+    # saved and returned directly.
+    fig = Figure(figsize=(16, 10))
+    axes = [fig.add_subplot(nrows, ncols, i + 1) for i in range(len(panels))]
 
     # Set style
     plt.style.use('default')
@@ -926,99 +1104,48 @@ def plot_baseline_comparison(participant_data, output_dir=''):
     # Colors for groups
     colors = [COLORS['ai'], COLORS['control']]  # Blue for AI, Pink for Control
 
-    # Plot baseline scores for each dimension
-    plot_idx = 0
-
-    # Individual dimensions
-    for dimension_num, dimension_label in dimensions.items():
-        pre_col = f'pre_se_{dimension_label}'
+    # Plot baseline scores for each panel
+    for ax, (pre_col, title) in zip(axes, panels):
+        values = participant_data[pre_col].to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        ai_data = values[ai_mask & valid]
+        control_data = values[control_mask & valid]
 
-        if pre_col in participant_data.columns:
-            ax = axes[plot_idx]
-
-            # Create box plot
-            ai_data = participant_data[participant_data['group']
-                                       == 'AI'][pre_col].dropna()
-            control_data = participant_data[participant_data['group']
-                                            == 'Control'][pre_col].dropna()
-
-            # Box plot
-            box_data = [ai_data, control_data]
-            bp = ax.boxplot(box_data, patch_artist=True,
-                            labels=['AI', 'Control'])
-
-            # Color the boxes
-            for patch, color in zip(bp['boxes'], colors):
-                patch.set_facecolor(color)
-                patch.set_alpha(0.7)
-
-            # Add statistics
-            from scipy.stats import ttest_ind, mannwhitneyu
-
-            if len(ai_data) > 0 and len(control_data) > 0:
-                t_stat, p_val = ttest_ind(ai_data, control_data)
-                effect_size = calculate_effect_size(ai_data, control_data)
-
-                # Add statistical annotation
-                ax.text(0.5, 0.95, f'p = {p_val:.3f}\nd = {effect_size:.3f}',
-                        transform=ax.transAxes, ha='center', va='top',
-                        bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
-
-                # Add mean values
-                ax.text(1, np.mean(ai_data), f'{np.mean(ai_data):.2f}',
-                        ha='center', va='bottom', fontweight='bold')
-                ax.text(2, np.mean(control_data), f'{np.mean(control_data):.2f}',
-                        ha='center', va='bottom', fontweight='bold')
-
-            ax.set_title(f'{dimension_label.title()}',
-                         fontsize=12, fontweight='bold')
-            ax.set_ylabel('Self-Efficacy Score')
-            ax.grid(True, alpha=0.3)
-
-            plot_idx += 1
-
-    # Overall baseline self-efficacy
-    if plot_idx < len(axes):
-        ax = axes[plot_idx]
-
-        ai_overall = participant_data[participant_data['group']
-                                      == 'AI']['pre_self_efficacy'].dropna()
-        control_overall = participant_data[participant_data['group']
-                                           == 'Control']['pre_self_efficacy'].dropna()
-
-        box_data = [ai_overall, control_overall]
-        bp = ax.boxplot(box_data, patch_artist=True, labels=['AI', 'Control'])
+        # Box plot from precomputed quartiles and whiskers
+        bp = ax.bxp([_box_stats(ai_data, 'AI'), _box_stats(control_data, 'Control')],
+                    patch_artist=True)
 
+        # Color the boxes
         for patch, color in zip(bp['boxes'], colors):
             patch.set_facecolor(color)
             patch.set_alpha(0.7)
 
-        if len(ai_overall) > 0 and len(control_overall) > 0:
-            t_stat, p_val = ttest_ind(ai_overall, control_overall)
-            effect_size = calculate_effect_size(ai_overall, control_overall)
+        # Add statistics from each group's moments, computed once
+        if len(ai_data) > 0 and len(control_data) > 0:
+            ai_mean, ai_std = _mean_std(ai_data)
+            control_mean, control_std = _mean_std(control_data)
+            t_stat, p_val = ttest_ind_from_stats(ai_mean, ai_std, ai_data.size,
+                                                 control_mean, control_std, control_data.size)
+            effect_size = calculate_effect_size_from_stats(
+                ai_mean, ai_std, ai_data.size, control_mean, control_std, control_data.size)
 
+            # Add statistical annotation
             ax.text(0.5, 0.95, f'p = {p_val:.3f}\nd = {effect_size:.3f}',
                     transform=ax.transAxes, ha='center', va='top',
                     bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
 
-            ax.text(1, np.mean(ai_overall), f'{np.mean(ai_overall):.2f}',
+            # Add mean values
+            ax.text(1, ai_mean, f'{ai_mean:.2f}',
                     ha='center', va='bottom', fontweight='bold')
-            ax.text(2, np.mean(control_overall), f'{np.mean(control_overall):.2f}',
+            ax.text(2, control_mean, f'{control_mean:.2f}',
                     ha='center', va='bottom', fontweight='bold')
 
-        ax.set_title('Overall Baseline\n(Mean of All Dimensions)',
-                     fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=12, fontweight='bold')
         ax.set_ylabel('Self-Efficacy Score')
         ax.grid(True, alpha=0.3)
 
-        plot_idx += 1
-
-    # Hide unused subplots
-    for i in range(plot_idx, len(axes)):
-        axes[i].set_visible(False)
-
-    plt.tight_layout()
-    plt.suptitle('Baseline Self-Efficacy Comparison: Checking Randomization Balance',
+    fig.tight_layout()
+    fig.suptitle('Baseline Self-Efficacy Comparison: Checking Randomization Balance',
                  fontsize=16, fontweight='bold', y=0.98)
 
     # Save the plot
@@ -1026,8 +1153,10 @@ def plot_baseline_comparison(participant_data, output_dir=''):
         for fmt in FIGURE_FORMATS:
             filename = f'figure_baseline_comparison.{fmt}'
             filepath = f'{output_dir}/{filename}' if output_dir else filename
-            plt.savefig(filepath, dpi=FIGURE_DPI, bbox_inches='tight')
+            fig.savefig(filepath, dpi=FIGURE_DPI, bbox_inches='tight')
         print(f"📁 Saved: {output_dir}/figure_baseline_comparison.pdf, png")
+        # Remember where the figure went so close_figure can report it
+        fig.set_label(f'{output_dir}/figure_baseline_comparison')
 
     return fig
 
@@ -1047,65 +1176,48 @@ def analyze_baseline_differences(participant_data):
     pandas.DataFrame : Statistical comparison of baselines
     """
     from data_processing import get_self_efficacy_dimensions
-    from scipy.stats import ttest_ind
 
     dimensions = get_self_efficacy_dimensions()
-    baseline_results = []
-
-    # Analyze each dimension
-    for dimension_num, dimension_label in dimensions.items():
-        pre_col = f'pre_se_{dimension_label}'
-
-        if pre_col in participant_data.columns:
-            ai_data = participant_data[participant_data['group']
-                                       == 'AI'][pre_col].dropna()
-            control_data = participant_data[participant_data['group']
-                                            == 'Control'][pre_col].dropna()
-
-            if len(ai_data) > 0 and len(control_data) > 0:
-                # Statistical test
-                t_stat, p_val = ttest_ind(ai_data, control_data)
-                effect_size = calculate_effect_size(ai_data, control_data)
-
-                baseline_results.append({
-                    'dimension': dimension_label,
-                    'ai_n': len(ai_data),
-                    'ai_mean': ai_data.mean(),
-                    'ai_std': ai_data.std(),
-                    'control_n': len(control_data),
-                    'control_mean': control_data.mean(),
-                    'control_std': control_data.std(),
-                    'mean_difference': ai_data.mean() - control_data.mean(),
-                    'effect_size': effect_size,
-                    'p_value': p_val,
-                    'significant': p_val < 0.05
-                })
-
-    # Overall baseline
-    ai_overall = participant_data[participant_data['group']
-                                  == 'AI']['pre_self_efficacy'].dropna()
-    control_overall = participant_data[participant_data['group']
-                                       == 'Control']['pre_self_efficacy'].dropna()
-
-    if len(ai_overall) > 0 and len(control_overall) > 0:
-        t_stat, p_val = ttest_ind(ai_overall, control_overall)
-        effect_size = calculate_effect_size(ai_overall, control_overall)
-
-        baseline_results.append({
-            'dimension': 'overall',
-            'ai_n': len(ai_overall),
-            'ai_mean': ai_overall.mean(),
-            'ai_std': ai_overall.std(),
-            'control_n': len(control_overall),
-            'control_mean': control_overall.mean(),
-            'control_std': control_overall.std(),
-            'mean_difference': ai_overall.mean() - control_overall.mean(),
-            'effect_size': effect_size,
-            'p_value': p_val,
-            'significant': p_val < 0.05
-        })
-
-    return pd.DataFrame(baseline_results)
+    labels = [label for label in dimensions.values()
+              if f'pre_se_{label}' in participant_data.columns]
+    pre_cols = [f'pre_se_{label}' for label in labels] + ['pre_self_efficacy']
+    labels.append('overall')
+
+    # Group moments for every dimension (and the overall score) in one pass
+    grouped = participant_data.groupby('group', observed=True)[pre_cols]
+    moments = grouped.agg(['count', 'mean', 'std']).reindex(['AI', 'Control'])
+    ai = moments.loc['AI'].unstack()
+    control = moments.loc['Control'].unstack()
+
+    ai_n = ai['count'].fillna(0).to_numpy(dtype=np.int64)
+    control_n = control['count'].fillna(0).to_numpy(dtype=np.int64)
+    ai_mean, ai_std = ai['mean'].to_numpy(float), ai['std'].to_numpy(float)
+    control_mean = control['mean'].to_numpy(float)
+    control_std = control['std'].to_numpy(float)
+
+    # Cohen's d and Student's t-test from the same moments
+    effect_size = calculate_effect_size_from_stats(ai_mean, ai_std, ai_n,
+                                                   control_mean, control_std, control_n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _, p_value = ttest_ind_from_stats(ai_mean, ai_std, ai_n,
+                                          control_mean, control_std, control_n)
+
+    # Only report comparisons with data in both groups
+    keep = (ai_n > 0) & (control_n > 0)
+    p_value = np.asarray(p_value)[keep]
+    return pd.DataFrame({
+        'dimension': np.array(labels, dtype=object)[keep],
+        'ai_n': ai_n[keep],
+        'ai_mean': ai_mean[keep],
+        'ai_std': ai_std[keep],
+        'control_n': control_n[keep],
+        'control_mean': control_mean[keep],
+        'control_std': control_std[keep],
+        'mean_difference': (ai_mean - control_mean)[keep],
+        'effect_size': effect_size[keep],
+        'p_value': p_value,
+        'significant': p_value < 0.05
+    })
 
 
 def create_consort_diagram_data():
@@ -1151,39 +1263,29 @@ def plot_baseline_adjusted_comparison(adjusted_results, output_dir=''):
     matplotlib.figure.Figure : The created figure
     """
 
-    # Extract data for plotting in standard order
-    standard_order = get_standard_dimension_order()
-    plot_data = []
+    # Extract data for plotting in standard order, one list per column
+    dimensions, raw_effects, adjusted_effects = [], [], []
+    for dim_name in get_standard_dimension_order():
+        results = adjusted_results.get(dim_name)
+        if results is not None and 'error' not in results:
+            dimensions.append('Overall' if dim_name == 'overall' else dim_name.title())
+            raw_effects.append(results.get('raw_effect_size', 0))
+            adjusted_effects.append(results.get('adjusted_effect_size', 0))
 
-    # Process in standard order
-    for dim_name in standard_order:
-        if dim_name in adjusted_results:
-            results = adjusted_results[dim_name]
-            if 'error' not in results:
-                display_name = 'Overall' if dim_name == 'overall' else dim_name.title()
-                plot_data.append({
-                    'dimension': display_name,
-                    'raw_effect_size': results.get('raw_effect_size', 0),
-                    'adjusted_effect_size': results.get('adjusted_effect_size', 0),
-                    'significant': results.get('significant', False),
-                    'baseline_difference': results.get('baseline_difference', 0)
-                })
-
-    if not plot_data:
+    if not dimensions:
         print("No data available for baseline-adjusted comparison plot")
         return None
 
     # Reverse order for plotting (so Overall appears at top)
-    plot_data = plot_data[::-1]
+    dimensions = dimensions[::-1]
+    raw_effects = np.asarray(raw_effects[::-1], dtype=float)
+    adjusted_effects = np.asarray(adjusted_effects[::-1], dtype=float)
 
-    # Create figure with single subplot
-    fig, ax = plt.subplots(1, 1, figsize=(10, 8))
+    # Create figure with single subplot (outside pyplot, see plot_baseline_comparison)
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots(1, 1)
 
     # Forest plot comparing raw vs adjusted effect sizes
-    dimensions = [item['dimension'] for item in plot_data]
-    raw_effects = [item['raw_effect_size'] for item in plot_data]
-    adjusted_effects = [item['adjusted_effect_size'] for item in plot_data]
-
     y_positions = np.arange(len(dimensions))
 
     # Plot raw effect sizes
@@ -1194,20 +1296,26 @@ def plot_baseline_adjusted_comparison(adjusted_results, output_dir=''):
     ax.scatter(adjusted_effects, y_positions - 0.1, color='#2E86AB', s=80,
                alpha=0.8, marker='o', label='Baseline-Adjusted')
 
-    # Connect raw and adjusted with lines
-    for i in range(len(dimensions)):
-        ax.plot([raw_effects[i], adjusted_effects[i]],
-                [y_positions[i] + 0.1, y_positions[i] - 0.1],
-                color='gray', alpha=0.5, linewidth=1)
-
-    # Add effect size interpretation regions
-    ax.axvspan(-0.8, -0.5, alpha=0.1, color='red', label='Large Negative')
-    ax.axvspan(-0.5, -0.2, alpha=0.1, color='orange',
-               label='Small-Medium Negative')
-    ax.axvspan(-0.2, 0.2, alpha=0.1, color='lightgray', label='Negligible')
-    ax.axvspan(0.2, 0.5, alpha=0.1, color='lightgreen',
-               label='Small-Medium Positive')
-    ax.axvspan(0.5, 0.8, alpha=0.1, color='green', label='Large Positive')
+    # Connect raw and adjusted with lines, as one collection
+    raw_points = np.column_stack([raw_effects, y_positions + 0.1])
+    adjusted_points = np.column_stack([adjusted_effects, y_positions - 0.1])
+    ax.add_collection(LineCollection(np.stack([raw_points, adjusted_points], axis=1),
+                                     colors='gray', alpha=0.5, linewidths=1,
+                                     capstyle='projecting'))
+
+    # Add effect size interpretation regions (large/small-medium negative,
+    # negligible, small-medium/large positive) as one collection; like
+    # axvspan they span the full height (x in data, y in axes units)
+    from matplotlib.collections import PatchCollection
+    from matplotlib.patches import Rectangle
+    region_edges = [-0.8, -0.5, -0.2, 0.2, 0.5, 0.8]
+    region_colors = ['red', 'orange', 'lightgray', 'lightgreen', 'green']
+    ax.add_collection(PatchCollection(
+        [Rectangle((x0, 0), x1 - x0, 1) for x0, x1 in zip(region_edges[:-1], region_edges[1:])],
+        transform=ax.get_xaxis_transform(), facecolors=region_colors,
+        edgecolors=region_colors, alpha=0.1), autolim=False)
+    ax.update_datalim([(region_edges[0], 0), (region_edges[-1], 0)], updatey=False)
+    ax.autoscale_view(scaley=False)
 
     ax.axvline(x=0, color='black', linestyle='--', alpha=0.5)
     ax.set_yticks(y_positions)
@@ -1228,17 +1336,19 @@ def plot_baseline_adjusted_comparison(adjusted_results, output_dir=''):
     ax.legend(handles=legend_elements, loc='upper right')
 
     # Adjust layout to prevent title overlap
-    plt.tight_layout()
-    plt.subplots_adjust(top=0.92)  # Leave space for title
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.92)  # Leave space for title
 
     # Save the plot
     if output_dir:
         for fmt in FIGURE_FORMATS:
             filename = f'figure_baseline_adjusted_effects.{fmt}'
             filepath = f'{output_dir}/{filename}' if output_dir else filename
-            plt.savefig(filepath, dpi=FIGURE_DPI, bbox_inches='tight')
+            fig.savefig(filepath, dpi=FIGURE_DPI, bbox_inches='tight')
         print(
             f"📁 Saved: {output_dir}/figure_baseline_adjusted_effects.pdf, png")
+        # Remember where the figure went so close_figure can report it
+        fig.set_label(f'{output_dir}/figure_baseline_adjusted_effects')
 
     return fig
 
@@ -1277,7 +1387,8 @@ def plot_baseline_adjusted_summary_table(adjusted_results, output_dir=''):
         print("No data available for baseline-adjusted summary table")
         return None
 
-    fig, ax = plt.subplots(figsize=(14, len(table_data) * 0.6 + 2))
+    fig = Figure(figsize=(14, len(table_data) * 0.6 + 2))
+    ax = fig.subplots()
     ax.axis('tight')
     ax.axis('off')
 
@@ -1285,13 +1396,13 @@ def plot_baseline_adjusted_summary_table(adjusted_results, output_dir=''):
     columns = ['Dimension', 'Raw d', 'Adjusted d',
                'Baseline Δ', 'Adj. p-value', 'Significant']
 
-    # Color code rows based on significance
-    cell_colors = []
-    for row in table_data:
-        if row[5] == "Yes":  # Significant
-            cell_colors.append(['#ffcccc'] * len(columns))  # Light red
-        else:
-            cell_colors.append(['white'] * len(columns))
+    # Color code rows based on significance (light red if significant),
+    # as one RGBA array so the colors are parsed once rather than per cell
+    from matplotlib.colors import to_rgba
+    significant = np.array([row[5] == "Yes" for row in table_data])
+    cell_colors = np.where(significant[:, None, None],
+                           to_rgba('#ffcccc'), to_rgba('white'))
+    cell_colors = np.broadcast_to(cell_colors, (len(table_data), len(columns), 4))
 
     table = ax.table(cellText=table_data, colLabels=columns,
                      cellLoc='center', loc='center',
@@ -1306,12 +1417,12 @@ def plot_baseline_adjusted_summary_table(adjusted_results, output_dir=''):
         table[(0, i)].set_facecolor('#4472C4')
         table[(0, i)].set_text_props(weight='bold', color='white')
 
-    plt.title('Baseline-Adjusted Analysis Summary\n' +
+    ax.set_title('Baseline-Adjusted Analysis Summary\n' +
               'Controlling for Pre-Intervention Self-Efficacy Scores',
               fontsize=14, fontweight='bold', pad=20)
 
     # Add footnote
-    plt.figtext(0.5, 0.02,
+    fig.text(0.5, 0.02,
                 'Note: Baseline Δ = AI group baseline mean - Control group baseline mean\n' +
                 'Negative adjusted effect sizes indicate lower post-intervention scores for AI group after controlling for baseline',
                 ha='center', fontsize=9, style='italic')
@@ -1321,8 +1432,10 @@ def plot_baseline_adjusted_summary_table(adjusted_results, output_dir=''):
         for fmt in FIGURE_FORMATS:
             filename = f'table_baseline_adjusted_summary.{fmt}'
             filepath = f'{output_dir}/{filename}' if output_dir else filename
-            plt.savefig(filepath, dpi=FIGURE_DPI, bbox_inches='tight')
+            fig.savefig(filepath, dpi=FIGURE_DPI, bbox_inches='tight')
         print(
             f"📁 Saved: {output_dir}/table_baseline_adjusted_summary.pdf, png")
+        # Remember where the figure went so close_figure can report it
+        fig.set_label(f'{output_dir}/table_baseline_adjusted_summary')
 
     return fig